@@ -1,9 +1,23 @@
-import math
+import importlib.util
+import os
 import random
+import sys
 import numpy as np
 import pandas as pd
 from typing import List, Tuple
 
+# componentes compartidos del recocido simulado (modulo1/recocido simulado): primero se
+# buscan en el PYTHONPATH; solo si no están se usa la carpeta del repositorio
+if importlib.util.find_spec("motor_recocido") is None:
+    _RUTA_RECOCIDO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "modulo1", "recocido simulado")
+    if not os.path.isfile(os.path.join(_RUTA_RECOCIDO, "motor_recocido.py")):
+        raise ImportError("SA.py necesita motor_recocido, esquema_temperatura y puntos_control "
+                          "(modulo1/recocido simulado); agrega esa carpeta al PYTHONPATH")
+    sys.path.append(_RUTA_RECOCIDO)
+from esquema_temperatura import EsquemaFijo
+from motor_recocido import ProblemaRecocido, recocer
+from puntos_control import aplanarRutas, huellaArreglo, rutasDesdeArreglos
+
 """
 reglas escogidas para esta simulacion del problema 
 min y maximos para los limites de tiendas por cedis
@@ -114,126 +128,331 @@ def calcular_costo_ruta_unica(cedi_idx: int, ruta: List[int], matriz: np.ndarray
 
     return costo_ruta_individual
 
+def calcular_costo_ruta(cedi_idx: int, ruta: List[int]) -> float:
+    """
+    Costo de una sola ruta tal como lo cuenta calcularCostoRutasTotales:
+    la penalización si la ruta está fuera de los límites MIN/MAX, si no su costo compuesto.
+    """
+    if len(ruta) < MIN_TIENDAS_POR_CEDIS or len(ruta) > MAX_TIENDAS_POR_CEDIS:
+        return PENALIZACION_COSTO_FUERA_LIMITE
+    return calcular_costo_ruta_unica(cedi_idx, ruta, MATRIZ_COMPUESTA)
+
+def calcular_costos_rutas(solucion: List[List[int]]) -> List[float]:
+    """
+    Costo de cada ruta (su suma es calcularCostoRutasTotales).
+    """
+    return [calcular_costo_ruta(cedi_idx, ruta) for cedi_idx, ruta in enumerate(solucion)]
+
 def generar_vecino(solucion_actual: List[List[int]]) -> Tuple[List[List[int]], str]:
     """
-    Genera una solución vecina aplicando un operador de movimiento aleatorio.
+    Genera una solución vecina aplicando un operador de movimiento aleatorio a una copia.
     Se prefieren los movimientos Inter-Ruta para explorar asignaciones.
+    El recocido no la usa: aplica los movimientos en sitio sin copiar.
     """
     vecino = [list(r) for r in solucion_actual]
 
     # 70% Inter-Ruta (Cambio de ASIGNACIÓN), 30% Intra-Ruta (Cambio de ORDEN)
     if random.random() < 0.7:
-        # Mover una tienda de un CEDIS a otro (Inter-Ruta)
         return generar_vecino_inter_ruta(vecino)
     else:
-        # Intercambiar dos tiendas dentro de la misma ruta (Intra-Ruta)
         return generar_vecino_intra_ruta(vecino)
 
-def generar_vecino_inter_ruta(vecino: List[List[int]]) -> Tuple[List[List[int]], str]:
+def proponer_movimiento(solucion: List[List[int]]) -> tuple:
+    """
+    Sortea un movimiento aleatorio sin modificar la solución.
+    Se prefieren los movimientos Inter-Ruta para explorar asignaciones.
+    Regresa la tupla del movimiento (ver aplicar_movimiento) o None si no hay uno válido.
+    """
+    # 70% Inter-Ruta (Cambio de ASIGNACIÓN), 30% Intra-Ruta (Cambio de ORDEN)
+    if random.random() < 0.7:
+        # Mover una tienda de un CEDIS a otro (Inter-Ruta)
+        return proponer_movimiento_inter_ruta(solucion)
+    else:
+        # Intercambiar dos tiendas dentro de la misma ruta (Intra-Ruta)
+        return proponer_movimiento_intra_ruta(solucion)
+
+def proponer_movimiento_inter_ruta(solucion: List[List[int]]) -> tuple:
     """
     Mueve una tienda de un CEDIS a otro (Asignación).
+    movimiento = ("mover", cedis_origen, posicion_origen, cedis_destino, posicion_destino, tienda);
+    la posición destino es en la ruta destino ya sin la tienda (puede ser el mismo CEDIS).
     """
 
     #Selecciona un CEDIS de origen que pueda ceder una tienda (ruta.length > MIN)
-    cedis_origen_candidatos = [i for i, r in enumerate(vecino) if len(r) > MIN_TIENDAS_POR_CEDIS]
+    cedis_origen_candidatos = [i for i, r in enumerate(solucion) if len(r) > MIN_TIENDAS_POR_CEDIS]
     if not cedis_origen_candidatos:
-        return vecino, "Inter-Ruta: No es posible mover (todos al mínimo)"
+        return None  # Inter-Ruta: No es posible mover (todos al mínimo)
     cedis_origen = random.choice(cedis_origen_candidatos)
-    tienda_idx_en_ruta = random.randrange(len(vecino[cedis_origen]))
-    tienda_movida = vecino[cedis_origen].pop(tienda_idx_en_ruta)
-    # Selecciona unos CEDIS de destino que pueda aceptar una tienda (ruta.length < MAX)
-    cedis_destino_candidatos = [i for i, r in enumerate(vecino) if len(r) < MAX_TIENDAS_POR_CEDIS]
+    tienda_idx_en_ruta = random.randrange(len(solucion[cedis_origen]))
+    # Selecciona unos CEDIS de destino que pueda aceptar una tienda (ruta.length < MAX),
+    # contando la ruta de origen ya sin la tienda
+    cedis_destino_candidatos = [i for i, r in enumerate(solucion)
+                                if len(r) - (i == cedis_origen) < MAX_TIENDAS_POR_CEDIS]
     if not cedis_destino_candidatos:
-        # Revertir la operación
-        vecino[cedis_origen].insert(tienda_idx_en_ruta, tienda_movida)
-        return vecino, "Inter-Ruta: No es posible mover (todos al máximo)"
+        return None  # Inter-Ruta: No es posible mover (todos al máximo)
     cedis_destino = random.choice(cedis_destino_candidatos)
-    #Insertar la tienda en una posición aleatoria en la ruta destino
-    pos_destino = random.randrange(len(vecino[cedis_destino]) + 1)
-    vecino[cedis_destino].insert(pos_destino, tienda_movida)
-    movimiento_info = f"Mover: T{tienda_movida} de C{cedis_origen + 1} a C{cedis_destino + 1}"
-    return vecino, movimiento_info
+    #Posición aleatoria en la ruta destino
+    pos_destino = random.randrange(len(solucion[cedis_destino]) - (cedis_destino == cedis_origen) + 1)
+    return ("mover", cedis_origen, tienda_idx_en_ruta, cedis_destino, pos_destino,
+            solucion[cedis_origen][tienda_idx_en_ruta])
 
-def generar_vecino_intra_ruta(vecino: List[List[int]]) -> Tuple[List[List[int]], str]:
+def proponer_movimiento_intra_ruta(solucion: List[List[int]]) -> tuple:
     """
     Intercambia el orden de dos tiendas dentro de la misma ruta (Orden).
+    movimiento = ("swap", cedis, posicion_i, posicion_j).
     """
 
     # Seleccionar un CEDIS (ruta) con al menos 2 tiendas
-    rutas_validas = [i for i, r in enumerate(vecino) if len(r) >= 2]
+    rutas_validas = [i for i, r in enumerate(solucion) if len(r) >= 2]
     if not rutas_validas:
         # Si no hay rutas de tamaño >= 2, intentar un movimiento Inter-Ruta
-        return generar_vecino_inter_ruta(vecino)
+        return proponer_movimiento_inter_ruta(solucion)
     cedi_idx = random.choice(rutas_validas)
-    ruta = vecino[cedi_idx]
     # Elegir dos posiciones para el swap
-    i, j = random.sample(range(len(ruta)), 2)
-    ruta[i], ruta[j] = ruta[j], ruta[i]
-    movimiento_info = f"Swap: Orden de T{ruta[i]} y T{ruta[j]} en C{cedi_idx + 1}"
-    return vecino, movimiento_info
+    i, j = random.sample(range(len(solucion[cedi_idx])), 2)
+    return ("swap", cedi_idx, i, j)
+
+def generar_vecino_inter_ruta(vecino: List[List[int]]) -> Tuple[List[List[int]], str]:
+    """
+    Mueve una tienda de un CEDIS a otro (Asignación) modificando vecino en sitio.
+    Envoltura de proponer_movimiento_inter_ruta + aplicar_movimiento; regresa (vecino, descripción).
+    """
+    movimiento = proponer_movimiento_inter_ruta(vecino)
+    if movimiento is None:
+        return vecino, "Inter-Ruta: No es posible mover"
+    aplicar_movimiento(vecino, movimiento)
+    return vecino, describir_movimiento(movimiento)
+
+def generar_vecino_intra_ruta(vecino: List[List[int]]) -> Tuple[List[List[int]], str]:
+    """
+    Intercambia el orden de dos tiendas dentro de la misma ruta (Orden) modificando vecino en sitio.
+    Envoltura de proponer_movimiento_intra_ruta + aplicar_movimiento; regresa (vecino, descripción).
+    """
+    movimiento = proponer_movimiento_intra_ruta(vecino)
+    if movimiento is None:
+        return vecino, "Inter-Ruta: No es posible mover"
+    aplicar_movimiento(vecino, movimiento)
+    return vecino, describir_movimiento(movimiento, vecino)
+
+def aplicar_movimiento(solucion: List[List[int]], movimiento: tuple):
+    """
+    Aplica el movimiento en sitio. La tupla misma es el registro para deshacerlo.
+    """
+    if movimiento[0] == "swap":
+        _, cedi_idx, i, j = movimiento
+        ruta = solucion[cedi_idx]
+        ruta[i], ruta[j] = ruta[j], ruta[i]
+    else:
+        _, cedis_origen, pos_origen, cedis_destino, pos_destino, tienda = movimiento
+        del solucion[cedis_origen][pos_origen]
+        solucion[cedis_destino].insert(pos_destino, tienda)
+
+def deshacer_movimiento(solucion: List[List[int]], movimiento: tuple):
+    """
+    Revierte un movimiento aplicado con aplicar_movimiento (rutas de a lo más MAX tiendas).
+    """
+    if movimiento[0] == "swap":
+        aplicar_movimiento(solucion, movimiento)  # el swap es su propio inverso
+    else:
+        _, cedis_origen, pos_origen, cedis_destino, pos_destino, tienda = movimiento
+        del solucion[cedis_destino][pos_destino]
+        solucion[cedis_origen].insert(pos_origen, tienda)
+
+def describir_movimiento(movimiento: tuple, solucion: List[List[int]] = None) -> str:
+    """
+    Texto del movimiento para el reporte (solucion hace falta para nombrar las tiendas de un swap).
+    """
+    if movimiento is None:
+        return "Sin movimiento válido"
+    if movimiento[0] == "mover":
+        _, cedis_origen, _, cedis_destino, _, tienda = movimiento
+        return f"Mover: T{tienda} de C{cedis_origen + 1} a C{cedis_destino + 1}"
+    _, cedi_idx, i, j = movimiento
+    if solucion is None:
+        return f"Swap: posiciones {i} y {j} en C{cedi_idx + 1}"
+    return f"Swap: Orden de T{solucion[cedi_idx][i]} y T{solucion[cedi_idx][j]} en C{cedi_idx + 1}"
+
+def delta_movimiento(solucion: List[List[int]], costos_rutas: List[float], movimiento: tuple) -> Tuple[float, list]:
+    """
+    Cambio de costo de aplicar movimiento sobre solucion, usando solo las aristas de
+    MATRIZ_COMPUESTA que el movimiento quita y agrega (O(1), sin importar cuántos CEDIS
+    ni tiendas haya). costos_rutas es el costo de cada ruta de solucion.
+    Regresa (delta, [(cedis, nuevo costo de su ruta), ...]).
+    """
+    m = MATRIZ_COMPUESTA
+    if movimiento[0] == "swap":
+        _, cedi_idx, i, j = movimiento
+        ruta = solucion[cedi_idx]
+        if costos_rutas[cedi_idx] == PENALIZACION_COSTO_FUERA_LIMITE:
+            nueva = list(ruta)
+            nueva[i], nueva[j] = nueva[j], nueva[i]
+            nuevo_costo = calcular_costo_ruta(cedi_idx, nueva)
+            return nuevo_costo - costos_rutas[cedi_idx], [(cedi_idx, nuevo_costo)]
+        i, j = min(i, j), max(i, j)
+        a, b = ruta[i], ruta[j]
+        antes_i = ruta[i - 1] if i > 0 else cedi_idx
+        despues_j = ruta[j + 1] if j + 1 < len(ruta) else cedi_idx
+        if j == i + 1:
+            # tiendas contiguas: antes_i -> a -> b -> despues_j  pasa a  antes_i -> b -> a -> despues_j
+            delta = (m[antes_i, b] + m[b, a] + m[a, despues_j]) - (m[antes_i, a] + m[a, b] + m[b, despues_j])
+        else:
+            despues_i = ruta[i + 1]
+            antes_j = ruta[j - 1]
+            delta = (m[antes_i, b] + m[b, despues_i] + m[antes_j, a] + m[a, despues_j]) \
+                - (m[antes_i, a] + m[a, despues_i] + m[antes_j, b] + m[b, despues_j])
+        return delta, [(cedi_idx, costos_rutas[cedi_idx] + delta)]
+
+    _, cedis_origen, pos_origen, cedis_destino, pos_destino, _ = movimiento
+    ruta_origen = solucion[cedis_origen]
+    ruta_destino = solucion[cedis_destino]
+    largo_origen = len(ruta_origen) - 1
+    largo_destino = len(ruta_destino) + (1 if cedis_destino != cedis_origen else 0)
+    fuera_de_limite = not (MIN_TIENDAS_POR_CEDIS <= largo_origen and largo_destino <= MAX_TIENDAS_POR_CEDIS)
+    if fuera_de_limite or PENALIZACION_COSTO_FUERA_LIMITE in (costos_rutas[cedis_origen], costos_rutas[cedis_destino]):
+        # con penalizaciones de por medio se recalculan solo las dos rutas afectadas
+        nueva_origen = list(ruta_origen)
+        tienda = nueva_origen.pop(pos_origen)
+        nueva_destino = nueva_origen if cedis_destino == cedis_origen else list(ruta_destino)
+        nueva_destino.insert(pos_destino, tienda)
+        cambios = [(cedis_origen, calcular_costo_ruta(cedis_origen, nueva_origen))]
+        if cedis_destino != cedis_origen:
+            cambios.append((cedis_destino, calcular_costo_ruta(cedis_destino, nueva_destino)))
+        return sum(c for _, c in cambios) - sum(costos_rutas[cedi] for cedi, _ in cambios), cambios
+
+    # quitar la tienda de su ruta: antes -> tienda -> despues  pasa a  antes -> despues
+    tienda = ruta_origen[pos_origen]
+    antes = ruta_origen[pos_origen - 1] if pos_origen > 0 else cedis_origen
+    despues = ruta_origen[pos_origen + 1] if pos_origen + 1 < len(ruta_origen) else cedis_origen
+    delta_origen = m[antes, despues] - m[antes, tienda] - m[tienda, despues]
+    # insertarla en la ruta destino en pos_destino; si es la misma ruta, las posiciones
+    # desde pos_origen en adelante se recorren un lugar (la tienda ya no está)
+    if cedis_destino == cedis_origen:
+        corrimiento = 1 if pos_destino >= pos_origen else 0
+        antes_idx = pos_destino - 1 + (1 if pos_destino - 1 >= pos_origen else 0)
+        largo_sin_tienda = len(ruta_origen) - 1
+    else:
+        corrimiento = 0
+        antes_idx = pos_destino - 1
+        largo_sin_tienda = len(ruta_destino)
+    antes = ruta_destino[antes_idx] if pos_destino > 0 else cedis_destino
+    despues = ruta_destino[pos_destino + corrimiento] if pos_destino < largo_sin_tienda else cedis_destino
+    if largo_sin_tienda:
+        delta_destino = m[antes, tienda] + m[tienda, despues] - m[antes, despues]
+    else:
+        delta_destino = m[cedis_destino, tienda] + m[tienda, cedis_destino]
+    if cedis_destino == cedis_origen:
+        delta = delta_origen + delta_destino
+        return delta, [(cedis_origen, costos_rutas[cedis_origen] + delta)]
+    return delta_origen + delta_destino, [(cedis_origen, costos_rutas[cedis_origen] + delta_origen),
+                                          (cedis_destino, costos_rutas[cedis_destino] + delta_destino)]
+
+class ProblemaRutas(ProblemaRecocido):
+    """
+    Asignación y orden de rutas para el motor común (motor_recocido).
+    Cada propuesta es solo la tupla del movimiento (proponer_movimiento); su delta sale de
+    delta_movimiento con el costo guardado de cada ruta (costos_rutas), sin recorrer las
+    demás rutas ni copiar la solución. Aceptar aplica el movimiento en sitio y actualiza
+    los costos de las rutas tocadas; un movimiento rechazado nunca se aplicó, así que
+    aplicar no guarda nada para deshacerlo (deshacer recalcula las dos rutas tocadas).
+    La mejor solución se copia sobre las mismas listas solo al mejorar.
+    """
+    def __init__(self, solucion: List[List[int]]):
+        self.solucion_actual = [list(r) for r in solucion]
+        self.costos_rutas = calcular_costos_rutas(self.solucion_actual)
+        self.costo_actual = sum(self.costos_rutas)
+        self.mejor_solucion = [list(r) for r in self.solucion_actual]
+        self.ultimo_movimiento = None  # última propuesta (para el reporte)
+        self._cambios = []
+
+    @property
+    def movimiento_info(self) -> str:
+        # el texto se arma solo al reportar, no en cada propuesta
+        return describir_movimiento(self.ultimo_movimiento, self.solucion_actual)
+
+    def proponer(self) -> tuple:
+        self.ultimo_movimiento = proponer_movimiento(self.solucion_actual)
+        return self.ultimo_movimiento
+
+    def delta(self, movimiento: tuple) -> float:
+        diferencia, self._cambios = delta_movimiento(self.solucion_actual, self.costos_rutas, movimiento)
+        return diferencia
+
+    def aplicar(self, movimiento: tuple):
+        aplicar_movimiento(self.solucion_actual, movimiento)
+        for cedi_idx, costo in self._cambios:
+            self.costo_actual += costo - self.costos_rutas[cedi_idx]
+            self.costos_rutas[cedi_idx] = costo
+
+    def deshacer(self, movimiento: tuple):
+        # el motor no lo llama (DELTA_APLICA es False); recalcula solo las rutas tocadas
+        deshacer_movimiento(self.solucion_actual, movimiento)
+        for cedi_idx in {movimiento[1], movimiento[3]} if movimiento[0] == "mover" else {movimiento[1]}:
+            costo = calcular_costo_ruta(cedi_idx, self.solucion_actual[cedi_idx])
+            self.costo_actual += costo - self.costos_rutas[cedi_idx]
+            self.costos_rutas[cedi_idx] = costo
+
+    def guardarMejor(self):
+        for mejor, ruta in zip(self.mejor_solucion, self.solucion_actual):
+            mejor[:] = ruta
 
-def recocidoSimulado(problema_inicial: List[List[int]]):
+    def mejorSolucion(self) -> List[List[int]]:
+        return [list(r) for r in self.mejor_solucion]
+
+    def estado(self) -> dict:
+        valores_actual, largos_actual = aplanarRutas(self.solucion_actual)
+        valores_mejor, largos_mejor = aplanarRutas(self.mejor_solucion)
+        return {"solucion_actual": valores_actual, "largos_actual": largos_actual,
+                "mejor_solucion": valores_mejor, "largos_mejor": largos_mejor,
+                "costo_ruta_actual": self.costo_actual}
+
+    def restaurar(self, estado: dict):
+        self.solucion_actual = rutasDesdeArreglos(estado["solucion_actual"], estado["largos_actual"])
+        self.mejor_solucion = rutasDesdeArreglos(estado["mejor_solucion"], estado["largos_mejor"])
+        self.costos_rutas = calcular_costos_rutas(self.solucion_actual)
+        self.costo_actual = estado["costo_ruta_actual"]
+
+
+def recocidoSimulado(problema_inicial: List[List[int]], esquema=EsquemaFijo, punto_control: str = None,
+                     cada_niveles: int = 50):
     """
     Implementación del recocido simulado para rutas y asignación.
+    esquema es la clase (o fábrica) del esquema de temperatura, p. ej. EsquemaAdaptativo.
+    Con punto_control se guarda el estado cada cada_niveles niveles; si el archivo ya
+    existe se reanuda desde ahí (problema_inicial solo se usa en una corrida nueva). Un
+    archivo de otra MATRIZ_COMPUESTA (se compara su huella) lanza ValueError y al
+    terminar se borra.
+    El ciclo de fases es el del motor común (motor_recocido.recocer).
     """
-    solucion_actual = [list(r) for r in problema_inicial]
-    costo_actual = calcularCostoRutasTotales(solucion_actual)
-    mejor_solucion = [list(r) for r in solucion_actual]
-    mejor_costo = costo_actual
+    problema = ProblemaRutas(problema_inicial)
+    costo_actual = problema.costo_actual
 
     print(f"Costo Inicial (Distancia Total): {costo_actual:.2f}\n")
 
     # Parámetros ajustados
     n_puntos = NUM_SUCURSALES
-    temp_de_arranque = 10.0
-    temp_maxima = 800.0
-    temp_minima = 1e-2
     iteraciones_por_nivel = n_puntos * 2
-    factor_calentamiento = 1.05
-    iteraciones_en_pico = n_puntos * 2
-    factor_enfriamiento = 0.98
-    #factor_enfriamiento = 1.0 - (1.0 / (n_puntos * 30.0))
-    # Control de fases
-    estado_actual = "CALENTAMIENTO"
-    temp_actual = temp_de_arranque
-    contador_pico = 0
-    iteracion = 1
-    print("----- Iniciando Proceso de Recocido Simulado -----")
-    while True:
-        swap_elegido_info = ""
-        costo_anterior = costo_actual
-        # Exploración del vecindario
-        for _ in range(iteraciones_por_nivel):
-            vecino, swap_elegido_info = generar_vecino(solucion_actual)
-            costo_vecino = calcularCostoRutasTotales(vecino)
-            diferencia_costo = costo_vecino - costo_actual
-            # Decisión: Aceptamos si es mejor o si la probabilidad lo permite
-            if diferencia_costo < 0 or random.random() < math.exp(-diferencia_costo / temp_actual):
-                solucion_actual = vecino
-                costo_actual = costo_vecino
-                if costo_actual < mejor_costo:
-                    mejor_solucion = [list(r) for r in solucion_actual]
-                    mejor_costo = costo_actual
-        # Lógica de Cambio de Fase
-        if estado_actual == "CALENTAMIENTO":
-            temp_actual *= factor_calentamiento
-            if temp_actual >= temp_maxima:
-                temp_actual = temp_maxima
-                estado_actual = "PICO_TEMPERATURA"
-        elif estado_actual == "PICO_TEMPERATURA":
-            contador_pico += 1
-            if contador_pico >= iteraciones_en_pico:
-                estado_actual = "ENFRIAMIENTO"
-        elif estado_actual == "ENFRIAMIENTO":
-            temp_actual *= factor_enfriamiento
-            if temp_actual < temp_minima:
-                break
+    control = esquema(
+        temp_de_arranque=10.0,
+        temp_maxima=800.0,
+        temp_minima=1e-2,
+        factor_calentamiento=1.05,
+        iteraciones_en_pico=n_puntos * 2,
+        factor_enfriamiento=0.98,
+        #factor_enfriamiento=1.0 - (1.0 / (n_puntos * 30.0))
+    )
+
+    def reporte(iteracion, control, costo_anterior, costo_actual, mejor_costo):
         # Reporte de la iteración
         if iteracion % 10 == 0 or costo_actual < costo_anterior:  # Imprime si hubo mejora
             print(
-                f"Iteración {iteracion:3}: Fase={estado_actual:<18} Temp={temp_actual:9.3f}, Costo={costo_actual:12.2f}, Mejor Costo={mejor_costo:12.2f} | {swap_elegido_info}")
-        iteracion += 1
-    return mejor_solucion, mejor_costo
+                f"Iteración {iteracion:3}: Fase={control.fase:<18} Temp={control.temperatura:9.3f}, Costo={costo_actual:12.2f}, Mejor Costo={mejor_costo:12.2f} | {problema.movimiento_info}")
+
+    print("----- Iniciando Proceso de Recocido Simulado -----")
+    _, mejor_costo = recocer(problema, control, costo_actual, iteraciones_por_nivel, reporte=reporte,
+                             punto_control=punto_control, cada_niveles=cada_niveles,
+                             n=sum(len(ruta) for ruta in problema_inicial),
+                             huella=huellaArreglo(MATRIZ_COMPUESTA) if punto_control is not None else None)
+    return problema.mejorSolucion(), mejor_costo
 
 if __name__ == "__main__":
     MATRIZ_COMPUESTA = cargar_matriz_Compuesta(RUTA_DATA)
@@ -11,6 +11,8 @@ mi implementacion de algoritmos geneticos para la solucion del problema del viaj
 import numpy as np
 import pandas as pd
 
+ELEMENTOS_POR_BLOQUE = 4_000_000  # valores temporales por bloque de filas de la matriz de distancias
+
 class Municipio:
     """
     clase municipio con sus coordenadas x e y
@@ -117,11 +119,17 @@ class AlgoritmoGenetico:
         """
         Crea matriz de distancias con NumPy:
         dist[i, j] = coord_i - coord_j
+        por bloques de filas, así no se crean matrices temporales NxN completas
         """
         coords = np.array([m.coord for m in self.municipios])  # (N, 2)
-        diff_x = coords[:, 0][:, None] - coords[:, 0][None, :]
-        diff_y = coords[:, 1][:, None] - coords[:, 1][None, :]
-        dist = np.sqrt(diff_x ** 2 + diff_y ** 2)
+        n = len(coords)
+        filas_por_bloque = max(1, ELEMENTOS_POR_BLOQUE // max(n, 1))
+        dist = np.empty((n, n))
+        for inicio in range(0, n, filas_por_bloque):
+            bloque = coords[inicio:inicio + filas_por_bloque]
+            diff_x = bloque[:, 0][:, None] - coords[:, 0][None, :]
+            diff_y = bloque[:, 1][:, None] - coords[:, 1][None, :]
+            dist[inicio:inicio + filas_por_bloque] = np.sqrt(diff_x ** 2 + diff_y ** 2)
         return dist
 
     # creacion de la poblacion inicial
@@ -1,4 +1,20 @@
 # Algorito tabu para la solucion de la n reinas
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from motor_tabu import ProblemaTabu, VencimientosTabu, buscar
+
+TENENCIA = 10          # iteraciones que una reina queda tabu despues de moverse
+MUESTRA_VECINOS = 32   # columnas al azar evaluadas como pareja del intercambio
+REINAS_AL_AZAR = 50    # ultimas columnas de la solucion voraz, llenas por minimo conflicto (n <= 50: todo al azar)
+PACIENCIA = 500        # iteraciones sin mejorar antes de reiniciar desde otra solucion inicial
+CADA_REVISION = 64     # iteraciones entre revisiones de la señal de paro del portafolio
+MODOS = ("tabu", "minconflictos")
+
+
 #Funcion para leer el numero de reinas
 def leerReinas(prompt:str )-> int:
     while True:
@@ -20,26 +36,570 @@ def leerIteraciones(prompt:str)-> int:
             return n
         except ValueError:
             print('Debes ingresar un numero valido')
+
+
+class TableroReinas:
+    """
+    Tablero como permutacion: reinas[columna] = fila.
+    Al ser permutacion cada fila y cada columna tiene exactamente una reina (el contador
+    de filas siempre vale 1), asi que solo se llevan los contadores de diagonales:
+        diag[columna - fila + n - 1]   diagonales principales
+        anti[columna + fila]           antidiagonales
+    pares es el numero de pares de reinas que se atacan. Con los contadores el delta
+    de intercambiar las filas de dos columnas cuesta O(1).
+    """
+    __slots__ = ("n", "reinas", "diag", "anti", "pares", "_columnas")
+
+    def __init__(self, reinas):
+        self.n = n = len(reinas)
+        self.reinas = np.array(reinas, dtype=np.int32)
+        self._columnas = np.arange(n, dtype=np.int32)
+        self.diag = np.bincount(self._columnas - self.reinas + n - 1, minlength=2 * n - 1).astype(np.int32)
+        self.anti = np.bincount(self._columnas + self.reinas, minlength=2 * n - 1).astype(np.int32)
+        self.pares = int(self._paresEn(self.diag) + self._paresEn(self.anti))
+
+    @staticmethod
+    def _paresEn(contadores):
+        contadores = contadores.astype(np.int64)
+        return (contadores * (contadores - 1) // 2).sum()
+
+    def conflictosPorReina(self):
+        """Numero de reinas que ataca cada reina (vector de n, calculado con NumPy)."""
+        return self.diag[self._columnas - self.reinas + self.n - 1] + self.anti[self._columnas + self.reinas] - 2
+
+    def conflictosDe(self, columna):
+        """Numero de reinas que ataca la reina de una columna, en O(1)."""
+        fila = int(self.reinas[columna])
+        return int(self.diag[columna - fila + self.n - 1]) + int(self.anti[columna + fila]) - 2
+
+    def _mover(self, columna, fila, signo):
+        """Quita (signo=-1) o pone (signo=1) la reina de columna en fila; regresa el cambio de pares."""
+        d = columna - fila + self.n - 1
+        a = columna + fila
+        if signo < 0:
+            self.diag[d] -= 1
+            self.anti[a] -= 1
+            return -int(self.diag[d]) - int(self.anti[a])
+        cambio = int(self.diag[d]) + int(self.anti[a])
+        self.diag[d] += 1
+        self.anti[a] += 1
+        return cambio
+
+    def deltaSwap(self, i, j):
+        """Cambio en pares si se intercambian las filas de las columnas i y j (no modifica el tablero)."""
+        fi = int(self.reinas[i])
+        fj = int(self.reinas[j])
+        delta = self._mover(i, fi, -1) + self._mover(j, fj, -1)
+        delta += self._mover(i, fj, 1) + self._mover(j, fi, 1)
+        # se deshace la simulacion
+        self._mover(i, fj, -1)
+        self._mover(j, fi, -1)
+        self._mover(i, fi, 1)
+        self._mover(j, fj, 1)
+        return delta
+
+    def aplicarSwap(self, i, j):
+        """Intercambia las filas de las columnas i y j; regresa el cambio en pares."""
+        fi = int(self.reinas[i])
+        fj = int(self.reinas[j])
+        delta = self._mover(i, fi, -1) + self._mover(j, fj, -1)
+        delta += self._mover(i, fj, 1) + self._mover(j, fi, 1)
+        self.reinas[i] = fj
+        self.reinas[j] = fi
+        self.pares += delta
+        return delta
+
+
+class ConjuntoIndexado:
+    """
+    Conjunto de enteros con alta, baja y sorteo en O(1): los elementos viven en una
+    lista y un dict guarda el lugar de cada uno; al quitar, el ultimo ocupa el hueco.
+    """
+    __slots__ = ("elementos", "_lugar")
+
+    def __init__(self, elementos=()):
+        self.elementos = []
+        self._lugar = {}
+        for elemento in elementos:
+            self.agregar(elemento)
+
+    def __len__(self):
+        return len(self.elementos)
+
+    def __contains__(self, elemento):
+        return elemento in self._lugar
+
+    def agregar(self, elemento):
+        if elemento not in self._lugar:
+            self._lugar[elemento] = len(self.elementos)
+            self.elementos.append(elemento)
+
+    def quitar(self, elemento):
+        lugar = self._lugar.pop(elemento, None)
+        if lugar is None:
+            return
+        ultimo = self.elementos.pop()
+        if ultimo != elemento:
+            self.elementos[lugar] = ultimo
+            self._lugar[ultimo] = lugar
+
+    def sortear(self, u):
+        """Elemento en la posicion u * len (u uniforme en [0, 1))."""
+        return self.elementos[int(u * len(self.elementos))]
+
+
+#Funciones para construir la solucion inicial
+def solucionInicialVoraz(n, rng, al_azar=REINAS_AL_AZAR):
+    """
+    Solucion inicial voraz al estilo de Sosic y Gu: columna por columna se prueba una
+    fila libre al azar y se queda si sus dos diagonales estan vacias. Las ultimas
+    al_azar columnas (o las que queden al agotar 3.08 n intentos) toman, una por una,
+    la fila libre con menos reinas en sus diagonales (minimo conflicto con los mismos
+    contadores), asi que solo esas pocas reinas pueden quedar en conflicto.
+    Si n <= al_azar no hay fase voraz y la solucion es una permutacion al azar.
+    """
+    reinas = list(range(n))
+    diag = [0] * (2 * n - 1)
+    anti = [0] * (2 * n - 1)
+    limite = n - al_azar
+    intentos = int(3.08 * n)
+    j = 0
+    while j < limite and intentos > 0:
+        sorteos = rng.random(min(intentos, 65536)).tolist()
+        intentos -= len(sorteos)
+        libres = n - j
+        for u in sorteos:
+            m = j + int(u * libres)
+            fila = reinas[m]
+            d = j - fila + n - 1
+            a = j + fila
+            if not diag[d] and not anti[a]:
+                reinas[m] = reinas[j]
+                reinas[j] = fila
+                diag[d] = 1
+                anti[a] = 1
+                j += 1
+                libres -= 1
+                if j >= limite:
+                    break
+    resto = reinas[j:]
+    rng.shuffle(resto)  # empates al azar
+    reinas[j:] = resto
+    if limite <= 0:
+        return reinas  # tablero chico: permutacion al azar, cada reinicio cae en otra cuenca
+    for columna in range(j, n):
+        mejor = min(range(columna, n),
+                    key=lambda m: diag[columna - reinas[m] + n - 1] + anti[columna + reinas[m]])
+        fila = reinas[mejor]
+        reinas[mejor] = reinas[columna]
+        reinas[columna] = fila
+        diag[columna - fila + n - 1] += 1
+        anti[columna + fila] += 1
+    return reinas
+
+
+def solucionInicialExplicita(n, rng=None):
+    """
+    Construccion explicita (sin busqueda) para n >= 4: las filas pares y luego las
+    impares (en numeracion 1..n). Si n % 6 es 2 o 3 esa lista tiene ataques y se
+    corrige como en la construccion clasica: con residuo 2 se intercambian el 1 y el 3
+    y el 5 pasa al final; con residuo 3 el 2 pasa al final de los pares y el 1 y el 3
+    al final de los impares. rng no se usa (la solucion es siempre la misma).
+    """
+    pares = list(range(2, n + 1, 2))
+    impares = list(range(1, n + 1, 2))
+    if n % 6 == 2 and n >= 8:
+        impares[0], impares[1] = 3, 1
+        impares.remove(5)
+        impares.append(5)
+    elif n % 6 == 3 and n >= 9:
+        pares.remove(2)
+        pares.append(2)
+        impares = [fila for fila in impares if fila not in (1, 3)] + [1, 3]
+    return [fila - 1 for fila in pares + impares]
+
+
+def solucionInicialAleatoria(n, rng):
+    """Permutacion al azar."""
+    return rng.permutation(n).tolist()
+
+
+SOLUCIONES_INICIALES = {
+    "voraz": solucionInicialVoraz,  # con n <= REINAS_AL_AZAR es igual a "aleatoria"
+    "explicita": solucionInicialExplicita,
+    "aleatoria": solucionInicialAleatoria,
+}
+
+
+class ProblemaReinas(ProblemaTabu):
+    """
+    N reinas para el motor tabu: movimientos (origen, destino) que intercambian las filas
+    de dos columnas; las dos columnas son los atributos tabu.
+    modo:
+        "tabu"          las reinas en conflicto se buscan en todo el tablero con NumPy, O(n) por iteracion
+        "minconflictos" las reinas en conflicto viven en un ConjuntoIndexado que se actualiza
+                        con cada movimiento, asi cada iteracion cuesta O(muestra) sin importar n
+    """
+
+    def __init__(self, n, rng, muestra=MUESTRA_VECINOS, modo="tabu", inicial="voraz"):
+        if modo not in MODOS:
+            raise ValueError(f"modo desconocido: {modo}")
+        if inicial not in SOLUCIONES_INICIALES:
+            raise ValueError(f"solucion inicial desconocida: {inicial}")
+        self.construir = SOLUCIONES_INICIALES[inicial]
+        self.n = n
+        self.rng = rng
+        self.muestra = muestra
+        self.modo = modo
+        self.reiniciar()
+        self.mejor_solucion = self.tablero.reinas.copy()
+
+    def reiniciar(self):
+        self.tablero = TableroReinas(self.construir(self.n, self.rng))
+        self.pendientes = None
+        if self.modo == "minconflictos":
+            self.pendientes = ConjuntoIndexado(np.flatnonzero(self.tablero.conflictosPorReina()).tolist())
+        return self.tablero.pares
+
+    def vecindario(self, iteracion, tabu):
+        # reina a mover (en conflicto y de preferencia no tabu) y columnas con las que se intercambia
+        rng = self.rng
+        muestra = self.muestra
+        if self.pendientes is None:
+            en_conflicto = np.flatnonzero(self.tablero.conflictosPorReina())
+            if not len(en_conflicto):
+                return []  # tablero resuelto: no hay reina que mover
+            permitidas = en_conflicto[tabu.tabu_hasta[en_conflicto] < iteracion]
+            origen = int(rng.choice(permitidas if len(permitidas) else en_conflicto))
+            if len(en_conflicto) > muestra:
+                en_conflicto = rng.choice(en_conflicto, muestra, replace=False)
+            candidatos = np.concatenate((rng.integers(0, self.n, muestra), en_conflicto))
+            rng.shuffle(candidatos)  # empates al azar
+            candidatos = candidatos.tolist()
+        else:
+            origen = _sortearEnConflicto(self.tablero, self.pendientes, tabu.tabu_hasta, iteracion,
+                                         rng.random(muestra).tolist())
+            if origen is None:
+                return []
+            candidatos = rng.integers(0, self.n, muestra).tolist()
+            candidatos += [self.pendientes.sortear(u)
+                           for u in rng.random(min(muestra, len(self.pendientes))).tolist()]
+        return [(origen, j) for j in candidatos if j != origen]
+
+    def delta(self, movimiento):
+        return self.tablero.deltaSwap(*movimiento)
+
+    def atributos(self, movimiento):
+        return movimiento
+
+    def aplicar(self, movimiento):
+        self.tablero.aplicarSwap(*movimiento)
+        if self.pendientes is not None:
+            for columna in movimiento:
+                if self.tablero.conflictosDe(columna) > 0:
+                    self.pendientes.agregar(columna)
+                else:
+                    self.pendientes.quitar(columna)
+
+    def guardarMejor(self):
+        np.copyto(self.mejor_solucion, self.tablero.reinas)
+
+    def mejorSolucion(self):
+        return self.mejor_solucion.tolist()
+
+
 #Funcion para calcular la solucion
-def Nreinastabu(n,i):
-    solucionActual =0
-    mejorsoulcion=0
-    listatabu=0
-    iteracionesmaximas=0
-    for iteracion in range(1, iteracionesmaximas + 1):
-    # 1. Generate neighborhood
-    # 2. Select the best candidate (not in tabu list or passes aspiration)
-    # 3. Update current_solution
-    # 4. Update tabu_list
-    # 5. Update best_solution if improved
-        print('Iteracion: ', iteracion)
-    return
+def Nreinastabu(n, i, semilla=None, tenencia=TENENCIA, muestra=MUESTRA_VECINOS, paciencia=PACIENCIA,
+                modo="tabu", inicial="voraz", verboso=True, progreso=None):
+    """
+    Busqueda tabu sobre la permutacion reinas[columna] = fila (corre en motor_tabu).
+    En cada iteracion se toma una reina en conflicto que no sea tabu y se evalua
+    intercambiarla con muestra columnas al azar y con otras reinas en conflicto;
+    se aplica el mejor intercambio permitido aunque empeore. Las dos reinas movidas
+    quedan tabu un numero de iteraciones sorteado entre 1 y tenencia (arreglo de
+    vencimientos; sortearlo evita ciclos en tableros chicos) y un movimiento tabu
+    solo se acepta si mejora la mejor solucion (aspiracion). Si pasan paciencia
+    iteraciones sin mejorar se reinicia desde otra solucion inicial.
+    modo es "tabu" o "minconflictos" (ver ProblemaReinas); inicial es la solucion de
+    arranque: "voraz", "explicita" o "aleatoria" (ver SOLUCIONES_INICIALES).
+    progreso(iteracion, tablero, columnas) se llama tras cada movimiento con las columnas
+    cuya fila cambio (None si cambio todo el tablero: al inicio y en cada reinicio);
+    si regresa False la busqueda se detiene.
+    Regresa (mejor solucion como lista, pares en conflicto, iteraciones usadas).
+    """
+    rng = np.random.default_rng(semilla)
+    problema = ProblemaReinas(n, rng, muestra, modo, inicial)
+    tabu = VencimientosTabu(n, max(1, min(tenencia, n // 2)), rng)
+    if progreso is not None and progreso(0, problema.tablero, None) is False:
+        return problema.mejorSolucion(), problema.tablero.pares, 0
+
+    def observador(iteracion, problema, movimiento, costo, mejor_costo):
+        if verboso:
+            print('Iteracion: ', iteracion, ' conflictos: ', costo, ' mejor: ', mejor_costo)
+        if progreso is not None:
+            return progreso(iteracion, problema.tablero, movimiento)
+
+    _, mejor_pares, iteraciones = buscar(problema, tabu, i, problema.tablero.pares, costo_objetivo=0,
+                                         paciencia=paciencia,
+                                         observador=observador if verboso or progreso is not None else None)
+    return problema.mejorSolucion(), mejor_pares, iteraciones
+
+
+def _sortearEnConflicto(tablero, pendientes, tabu_hasta, iteracion, sorteos):
+    """
+    Sortea una reina de pendientes que siga en conflicto y no sea tabu (o la ultima tabu
+    vista si no hay otra). Las que ya no tienen conflictos se quitan al encontrarlas:
+    toda pareja que se ataca tiene al menos una reina en pendientes, porque la reina que
+    llega a una diagonal ocupada se agrega, y solo se quitan reinas sin conflictos.
+    """
+    tabu = None
+    for u in sorteos:
+        if not pendientes:
+            break
+        columna = pendientes.sortear(u)
+        if tablero.conflictosDe(columna) == 0:
+            pendientes.quitar(columna)
+        elif tabu_hasta[columna] < iteracion:
+            return columna
+        else:
+            tabu = columna
+    return tabu
+
+
+
+#Funciones para el portafolio de busquedas tabu en paralelo
+_detener = None  # multiprocessing.Event compartido por los procesos del portafolio
+
+
+def _iniciarPortafolio(evento):
+    global _detener
+    _detener = evento
+
+
+def _correrSemilla(n, i, semilla, opciones):
+    """Corre Nreinastabu con una semilla; se detiene cuando otra semilla ya encontro solucion."""
+    def progreso(iteracion, tablero, columnas):
+        return iteracion % CADA_REVISION != 0 or not _detener.is_set()
+
+    if _detener.is_set():
+        return semilla, None, None, 0, 0.0  # otra semilla ya termino: ni se construye el tablero
+    t0 = time.perf_counter()
+    solucion, conflictos, iteraciones = Nreinastabu(n, i, semilla=semilla, verboso=False,
+                                                    progreso=progreso, **opciones)
+    return semilla, solucion, conflictos, iteraciones, time.perf_counter() - t0
+
+
+def portafolioTabu(n, i, semillas=8, procesos=None, verboso=True, **opciones):
+    """
+    Lanza Nreinastabu con varias semillas en un pool de procesos (semillas es un numero
+    o una lista). En cuanto una llega a cero conflictos se avisa a las demas con un
+    evento compartido: las que corren paran en menos de CADA_REVISION iteraciones y las
+    que no han empezado se cancelan. opciones se pasa a Nreinastabu (modo, tenencia...).
+    Regresa (mejor solucion, conflictos, resumen) con resumen = lista de dicts por semilla
+    con iteraciones, conflictos, segundos y estado (solucion, detenida, agotada o cancelada).
+    Las canceladas (sin una sola iteracion) no son datos de iteraciones: conviene
+    filtrarlas por estado antes de promediar.
+    """
+    semillas = list(range(semillas)) if isinstance(semillas, int) else list(semillas)
+    evento = multiprocessing.Event()
+    resumen = []
+    mejor = None
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciarPortafolio, initargs=(evento,)) as pool:
+        futuros = {pool.submit(_correrSemilla, n, i, semilla, opciones): semilla for semilla in semillas}
+        for futuro in as_completed(futuros):
+            if futuro.cancelled():
+                continue
+            semilla, solucion, conflictos, iteraciones, segundos = futuro.result()
+            if solucion is None or (evento.is_set() and iteraciones == 0 and conflictos != 0):
+                # el pool ya la habia entregado a un proceso, asi que cancel() no la alcanzo
+                estado = "cancelada"
+            elif conflictos == 0 and not evento.is_set():
+                evento.set()
+                for pendiente in futuros:
+                    pendiente.cancel()
+                estado = "solucion"
+            elif conflictos == 0:
+                estado = "solucion"
+            else:
+                estado = "detenida" if evento.is_set() and iteraciones < i else "agotada"
+            resumen.append({"semilla": semilla, "iteraciones": iteraciones, "conflictos": conflictos,
+                            "segundos": segundos, "estado": estado})
+            if solucion is not None and (mejor is None or conflictos < mejor[1]):
+                mejor = (solucion, conflictos)
+            if verboso:
+                print(f'semilla {semilla}: {estado}, {iteraciones} iteraciones, '
+                      f'{conflictos} conflictos, {segundos:.2f}s')
+    for futuro, semilla in futuros.items():
+        if futuro.cancelled():
+            resumen.append({"semilla": semilla, "iteraciones": 0, "conflictos": None,
+                            "segundos": 0.0, "estado": "cancelada"})
+            if verboso:
+                print(f'semilla {semilla}: cancelada')
+    return mejor[0], mejor[1], resumen
+
+
+#Funciones para resolver lotes de trabajos sin preguntar nada
+def leerTrabajos(fuentes, modo="minconflictos"):
+    """
+    Trabajos (n, iteraciones, semilla, modo) desde argumentos "n,iteraciones,semilla[,modo]"
+    o desde archivos con un trabajo por linea (separado por comas o espacios; # para
+    comentarios). Sin modo en la linea se usa modo. Un trabajo invalido (n < 1,
+    iteraciones < 0, modo desconocido) lanza ValueError antes de empezar el lote.
+    """
+    trabajos = []
+    for fuente in fuentes:
+        if "," in fuente:
+            lineas = [fuente]
+        else:
+            with open(fuente, encoding="utf-8") as archivo:
+                lineas = archivo.readlines()
+        for numero, linea in enumerate(lineas, 1):
+            valores = linea.split("#", 1)[0].replace(",", " ").split()
+            if not valores:
+                continue
+            try:
+                n, iteraciones, semilla = (int(valor) for valor in valores[:3])
+            except ValueError:
+                raise ValueError(f"{fuente}:{numero}: se esperaba n,iteraciones,semilla[,modo]") from None
+            modo_trabajo = valores[3] if len(valores) > 3 else modo
+            if n < 1 or iteraciones < 0 or modo_trabajo not in MODOS:
+                raise ValueError(f"{fuente}:{numero}: trabajo invalido (n >= 1, iteraciones >= 0, "
+                                 f"modo en {MODOS}): {linea.strip()}")
+            trabajos.append((n, iteraciones, semilla, modo_trabajo))
+    return trabajos
+
+
+def _resolverTrabajo(n, i, semilla, modo):
+    t0 = time.perf_counter()
+    _, conflictos, iteraciones = Nreinastabu(n, i, semilla=semilla, modo=modo, verboso=False)
+    return {"n": n, "iteraciones_max": i, "semilla": semilla, "modo": modo, "iteraciones": iteraciones,
+            "conflictos": conflictos, "segundos": time.perf_counter() - t0}
+
+
+def resolverLote(trabajos, salida, procesos=None, modo="minconflictos", verboso=True):
+    """
+    Resuelve los trabajos (n, iteraciones, semilla[, modo]) en un pool de procesos y agrega
+    una linea JSON por resultado a salida en cuanto termina cada uno (el archivo se abre en
+    modo agregar, asi una corrida interrumpida conserva lo ya escrito). modo es el de los
+    trabajos que no traen el suyo. Un trabajo que falla deja una linea con "error" en vez
+    de detener el lote.
+    Regresa el numero de trabajos resueltos (sin contar los que fallaron).
+    """
+    resueltos = 0
+    terminados = 0
+    with open(salida, "a", encoding="utf-8") as archivo, ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = {}
+        for n, i, semilla, *resto in trabajos:
+            modo_trabajo = resto[0] if resto else modo
+            futuros[pool.submit(_resolverTrabajo, n, i, semilla, modo_trabajo)] = (n, i, semilla, modo_trabajo)
+        for futuro in as_completed(futuros):
+            terminados += 1
+            try:
+                resultado = futuro.result()
+            except Exception as error:
+                n, i, semilla, modo_trabajo = futuros[futuro]
+                resultado = {"n": n, "iteraciones_max": i, "semilla": semilla, "modo": modo_trabajo,
+                             "error": f"{type(error).__name__}: {error}"}
+            archivo.write(json.dumps(resultado) + "\n")
+            archivo.flush()
+            if "error" in resultado:
+                if verboso:
+                    print(f'[{terminados}/{len(trabajos)}] N={resultado["n"]} semilla={resultado["semilla"]}: '
+                          f'error {resultado["error"]}')
+                continue
+            resueltos += 1
+            if verboso:
+                print(f'[{terminados}/{len(trabajos)}] N={resultado["n"]} semilla={resultado["semilla"]}: '
+                      f'{resultado["conflictos"]} conflictos, {resultado["iteraciones"]} iteraciones, '
+                      f'{resultado["segundos"]:.2f}s')
+    return resueltos
+
+
+#Funciones para contar todas las soluciones (backtracking con mascaras de bits)
+def _contarSubarbol(completo, columnas, diag_izq, diag_der):
+    """
+    Cuenta soluciones y nodos bajo un tablero parcial. columnas, diag_izq y diag_der son
+    mascaras de bits de las columnas atacadas en la siguiente fila; al bajar de fila las
+    diagonales se recorren un bit a la izquierda o a la derecha. completo = (1 << n) - 1.
+    Regresa (soluciones, nodos explorados).
+    """
+    libres = completo & ~(columnas | diag_izq | diag_der)
+    soluciones = 0
+    nodos = 1
+    while libres:
+        bit = libres & -libres
+        libres ^= bit
+        siguiente = columnas | bit
+        if siguiente == completo:
+            soluciones += 1
+            nodos += 1
+        else:
+            cuenta, explorados = _contarSubarbol(completo, siguiente, ((diag_izq | bit) << 1) & completo,
+                                                 (diag_der | bit) >> 1)
+            soluciones += cuenta
+            nodos += explorados
+    return soluciones, nodos
+
+
+def _contarPrimeraFila(n, columna):
+    """Soluciones y nodos con la reina de la primera fila en columna."""
+    completo = (1 << n) - 1
+    bit = 1 << columna
+    if bit == completo:
+        return 1, 1
+    return _contarSubarbol(completo, bit, (bit << 1) & completo, bit >> 1)
+
+
+def contarSoluciones(n, procesos=None, verboso=True):
+    """
+    Cuenta todas las soluciones de n reinas por backtracking con mascaras de bits.
+    Por simetria de espejo solo se exploran las reinas de la primera fila en la mitad
+    izquierda (y se cuentan doble) mas la columna central si n es impar; cada columna
+    de la primera fila es un trabajo del pool de procesos.
+    Regresa (soluciones, nodos explorados, segundos).
+    """
+    mitad = n // 2
+    trabajos = list(range(mitad)) + ([mitad] if n % 2 else [])
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        resultados = list(pool.map(_contarPrimeraFila, [n] * len(trabajos), trabajos))
+    segundos = time.perf_counter() - t0
+    soluciones = 2 * sum(cuenta for cuenta, _ in resultados[:mitad])
+    if n % 2:
+        soluciones += resultados[mitad][0]
+    nodos = sum(explorados for _, explorados in resultados)
+    if verboso:
+        print(f'N={n}: {soluciones} soluciones, {nodos} nodos en {segundos:.2f}s '
+              f'({nodos / max(segundos, 1e-9):,.0f} nodos/s)')
+    return soluciones, nodos, segundos
 
 
 
 if __name__ == '__main__':
+    if sys.argv[1:2] == ['contar']:
+        # python Nreinas.py contar N [procesos]
+        contarSoluciones(int(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) > 3 else None)
+        sys.exit()
+    if sys.argv[1:2] == ['portafolio']:
+        # python Nreinas.py portafolio N iteraciones [semillas]
+        portafolioTabu(int(sys.argv[2]), int(sys.argv[3]), int(sys.argv[4]) if len(sys.argv) > 4 else 8,
+                       modo="minconflictos")
+        sys.exit()
+    if sys.argv[1:2] == ['lote']:
+        # python Nreinas.py lote salida.jsonl [--modo tabu|minconflictos] (trabajos.txt | n,iteraciones,semilla[,modo] ...)
+        fuentes = sys.argv[3:]
+        modo = "minconflictos"
+        if fuentes[:1] == ["--modo"]:
+            modo, fuentes = fuentes[1], fuentes[2:]
+        resolverLote(leerTrabajos(fuentes, modo), sys.argv[2])
+        sys.exit()
     N = leerReinas('ingresa el numero de reinas:')
     print('Calculando para ', N, 'Reinas')
     I = leerIteraciones('ingresa el numero de iteraciones:')
     print('Calculando para ', I, 'iteraciones')
-    Nreinastabu(N,I)
\ No newline at end of file
+    t0 = time.perf_counter()
+    solucion, conflictos, iteraciones = Nreinastabu(N,I)
+    t1 = time.perf_counter()
+    print('Conflictos: ', conflictos, ' iteraciones: ', iteraciones, f' tiempo: {t1 - t0:.2f}s')
+    if N <= 30:
+        print('Solucion (fila de la reina en cada columna): ', solucion)
@@ -0,0 +1,77 @@
+"""
+benchmark_inicial.py
+Comparación de las soluciones iniciales de Nreinastabu (modo minconflictos):
+explicita (construcción cerrada, sin búsqueda)
+voraz (Sosic y Gu con relleno de mínimo conflicto; con N <= REINAS_AL_AZAR = 50
+       no hay fase voraz y es lo mismo que aleatoria, por eso los casos son grandes)
+aleatoria (permutación al azar)
+
+Métrica:
+Conflictos (pares que se atacan) de la solución inicial
+Iteraciones hasta la solución (promedio y peor caso)
+Tiempo de construcción y tiempo total
+
+Casos:
+N = 10^3, 10^4, 10^5
+REPETICIONES semillas por caso (SEED, SEED + 1, ...)
+Semilla fija: 777
+"""
+
+import time
+import numpy as np
+import pandas as pd
+
+from Nreinas import Nreinastabu, SOLUCIONES_INICIALES, TableroReinas
+
+SEED = 777
+TAM_TABLEROS = [10 ** 3, 10 ** 4, 10 ** 5]
+REPETICIONES = 5
+MAX_ITERACIONES = 10 ** 6
+
+
+def medir_construccion(n, inicial, semilla):
+    rng = np.random.default_rng(semilla)
+    t0 = time.perf_counter()
+    reinas = SOLUCIONES_INICIALES[inicial](n, rng)
+    t1 = time.perf_counter()
+    return TableroReinas(reinas).pares, t1 - t0
+
+
+def medir_busqueda(n, inicial, semilla):
+    t0 = time.perf_counter()
+    _, conflictos, iteraciones = Nreinastabu(n, MAX_ITERACIONES, semilla=semilla, modo="minconflictos",
+                                             inicial=inicial, verboso=False)
+    t1 = time.perf_counter()
+    return conflictos, iteraciones, t1 - t0
+
+
+if __name__ == "__main__":
+    resultados = []
+
+    print("\nBenchmark de soluciones iniciales para Nreinastabu")
+    print(f"Semilla usada: {SEED}\n")
+
+    for n in TAM_TABLEROS:
+        print(f"=== N={n} ===")
+        for inicial in SOLUCIONES_INICIALES:
+            iniciales, construcciones, iteraciones, tiempos, resueltas = [], [], [], [], 0
+            for k in range(REPETICIONES):
+                pares, t_construccion = medir_construccion(n, inicial, SEED + k)
+                conflictos, usadas, t_total = medir_busqueda(n, inicial, SEED + k)
+                iniciales.append(pares)
+                construcciones.append(t_construccion)
+                iteraciones.append(usadas)
+                tiempos.append(t_total)
+                resueltas += conflictos == 0
+            print(f"{inicial:<10}-> conflictos iniciales={np.mean(iniciales):.0f}  "
+                  f"iteraciones={np.mean(iteraciones):.0f} (máx {max(iteraciones)})  "
+                  f"t={np.mean(tiempos):.3f}s  resueltas={resueltas}/{REPETICIONES}")
+            resultados.append({"N": n, "Inicial": inicial, "Conflictos iniciales": np.mean(iniciales),
+                               "Iteraciones (prom)": np.mean(iteraciones), "Iteraciones (máx)": max(iteraciones),
+                               "Construcción (s)": np.mean(construcciones), "Total (s)": np.mean(tiempos),
+                               "Resueltas": f"{resueltas}/{REPETICIONES}"})
+        print()
+
+    print("\n Tabla comparativa:\n")
+    df = pd.DataFrame(resultados)
+    print(df.to_string(index=False))
@@ -1,6 +1,8 @@
 import random
 import time
 
+from motor_tabu import ListaTabu, ProblemaTabu, buscar
+
 
 def print_array_view(array, current_pos, neighbors, chosen, target, window=40):
     start = max(0, current_pos - window // 2)
@@ -21,42 +23,75 @@ def print_array_view(array, current_pos, neighbors, chosen, target, window=40):
     print("".join(view))
 
 
-def tabu_search_visual(array, target, max_iters=50, tabu_size=5, neighborhood_size=5):
-    n = len(array)
-    current_pos = random.randint(0, n - 1)
-    best_pos = current_pos
-    tabu_list = []
+class ArrayTargetProblem(ProblemaTabu):
+    """Walk over the positions of an array towards target; a position scores its distance to target."""
+
+    def __init__(self, n, target, start, neighborhood_size):
+        self.n = n
+        self.target = target
+        self.neighborhood_size = neighborhood_size
+        self.position = start
+        self.previous = start
+        self.best_pos = start
+        self.candidates = []
 
-    print(f"Start at position {current_pos}, target = {target}\n")
+    def score(self, pos):
+        return abs(pos - self.target)
 
-    for step in range(max_iters):
-        neighbors = [(current_pos + i) % n for i in range(-neighborhood_size, neighborhood_size + 1) if i != 0]
-        candidates = [pos for pos in neighbors if pos not in tabu_list]
+    def vecindario(self, iteracion, tabu):
+        k = self.neighborhood_size
+        neighbors = [(self.position + i) % self.n for i in range(-k, k + 1) if i != 0]
+        self.candidates = [pos for pos in neighbors if pos not in tabu]
+        return self.candidates
 
-        scores = {pos: abs(pos - target) for pos in candidates}
-        next_pos = min(scores, key=scores.get)
+    def delta(self, pos):
+        return self.score(pos) - self.score(self.position)
 
-        print(f"Step {step + 1}")
-        print_array_view(array, current_pos, candidates, next_pos, target)
-        print(f"Current = {current_pos}, Chosen = {next_pos}, Distance to target = {abs(next_pos - target)}\n")
+    def atributos(self, pos):
+        return (pos,)
 
-        tabu_list.append(current_pos)
-        if len(tabu_list) > tabu_size:
-            tabu_list.pop(0)
+    def atributosTabu(self, pos):
+        return (self.position,)  # the position we leave becomes tabu
 
-        current_pos = next_pos
+    def aplicar(self, pos):
+        self.previous = self.position
+        self.position = pos
 
-        if current_pos == target:
-            print(f"Target found at position {current_pos}!")
-            return current_pos
+    def guardarMejor(self):
+        self.best_pos = self.position
 
-        time.sleep(0.3)  # small delay for readability
+    def mejorSolucion(self):
+        return self.best_pos
 
-    print("Finished without exact match. Best found =", best_pos)
+
+def tabu_search_visual(array, target, max_iters=50, tabu_size=5, neighborhood_size=5, visual=True, delay=0.3):
+    n = len(array)
+    current_pos = random.randint(0, n - 1)
+    problem = ArrayTargetProblem(n, target, current_pos, neighborhood_size)
+
+    def show_step(step, problem, next_pos, distance, best_distance):
+        print(f"Step {step}")
+        print_array_view(array, problem.previous, problem.candidates, next_pos, target)
+        print(f"Current = {problem.previous}, Chosen = {next_pos}, Distance to target = {distance}\n")
+        if distance != 0:
+            time.sleep(delay)  # small delay for readability
+
+    if visual:
+        print(f"Start at position {current_pos}, target = {target}\n")
+    # headless (visual=False): no printing and no sleeps, the search runs at full speed
+    _, best_distance, _ = buscar(problem, ListaTabu(tabu_size), max_iters, problem.score(current_pos),
+                                 aspiracion=None, costo_objetivo=0, observador=show_step if visual else None)
+    best_pos = problem.mejorSolucion()
+    if visual:
+        if best_distance == 0:
+            print(f"Target found at position {best_pos}!")
+        else:
+            print("Finished without exact match. Best found =", best_pos)
     return best_pos
 
 
-# Example usage
-array = list(range(100))
-target_pos = 4
-found_pos = tabu_search_visual(array, target_pos)
+if __name__ == "__main__":
+    # Example usage
+    array = list(range(100))
+    target_pos = 4
+    found_pos = tabu_search_visual(array, target_pos)
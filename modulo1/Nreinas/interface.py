@@ -1,9 +1,18 @@
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QLabel, QVBoxLayout,
-    QDialog, QFormLayout, QLineEdit, QDialogButtonBox, QMessageBox, QTableWidget, QTableWidgetItem
+    QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
+    QDialog, QFormLayout, QLineEdit, QDialogButtonBox, QMessageBox, QTableView, QHeaderView
 )
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, QThread, Qt, Signal, Slot
 import sys
+import threading
+import time
+import numpy as np
+
+from Nreinas import Nreinastabu
+
+FRAMES_PER_SECOND = 30  # max board/label refreshes per second sent by the worker
+CELL_SIZE = 22          # board cell size in pixels
+
 
 class ParameterDialog(QDialog):
     def __init__(self):
@@ -27,6 +36,107 @@ class ParameterDialog(QDialog):
         return self.n_input.text(), self.iter_input.text()
 
 
+class BoardModel(QAbstractTableModel):
+    """
+    N x N board backed only by the permutation rows[column] = row (memory O(N)).
+    Cells are computed on demand in data(), so the view asks only for the visible ones.
+    """
+    def __init__(self):
+        super().__init__()
+        self.rows = np.zeros(0, dtype=np.int32)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return "Q" if self.rows[index.column()] == index.row() else None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def set_board(self, rows):
+        self.beginResetModel()
+        self.rows = np.array(rows, dtype=np.int32)
+        self.endResetModel()
+
+    def move_queens(self, moved):
+        """Applies {column: row} and refreshes only the old and new cell of each moved queen."""
+        for column, row in moved.items():
+            old_row = int(self.rows[column])
+            self.rows[column] = row
+            for changed in (old_row, row):
+                cell = self.index(changed, column)
+                self.dataChanged.emit(cell, cell, [Qt.DisplayRole])
+
+
+class TabuSearchWorker(QObject):
+    """
+    Runs Nreinastabu off the GUI thread.
+    Moves are collected in a {column: row} dict and emitted at most FRAMES_PER_SECOND
+    times per second, so the GUI only repaints the queens that moved since the last frame.
+    """
+    board_reset = Signal(object)               # full board as an int32 array (start, restart, final best)
+    progress = Signal(int, int, int, object)   # iteration, conflicts, best conflicts, {column: row}
+    finished = Signal(list, int, int)          # best solution, conflicts, iterations
+
+    def __init__(self, n, max_iters, frames_per_second=FRAMES_PER_SECOND):
+        super().__init__()
+        self.n = n
+        self.max_iters = max_iters
+        self.interval = 1.0 / frames_per_second
+        self._stop = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+        self._pending = {}
+        self._best = None
+        self._last_emit = 0.0
+
+    @Slot()
+    def run(self):
+        solution, conflicts, iterations = Nreinastabu(self.n, self.max_iters, modo="minconflictos",
+                                                      verboso=False, progreso=self._on_progress)
+        self.board_reset.emit(np.array(solution, dtype=np.int32))
+        self.finished.emit(solution, conflicts, iterations)
+
+    def _on_progress(self, iteration, board, columns):
+        # called from the solver loop on the worker thread
+        if self._stop.is_set():
+            return False
+        self._best = board.pares if self._best is None else min(self._best, board.pares)
+        if columns is None:
+            self._pending.clear()
+            self.board_reset.emit(board.reinas.copy())
+        else:
+            for column in columns:
+                self._pending[column] = int(board.reinas[column])
+        paused = not self._running.is_set()
+        now = time.perf_counter()
+        if paused or now - self._last_emit >= self.interval:
+            self._last_emit = now
+            self.progress.emit(iteration, board.pares, self._best, self._pending)
+            self._pending = {}
+        if paused:
+            self._running.wait()  # the board shown while paused is the current one
+        return not self._stop.is_set()
+
+    def stop(self):
+        self._stop.set()
+        self._running.set()
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def is_paused(self):
+        return not self._running.is_set()
+
+
 class TabuSearchInterface(QWidget):
     def __init__(self):
         super().__init__()
@@ -37,13 +147,28 @@ class TabuSearchInterface(QWidget):
         self.run_button.clicked.connect(self.ask_parameters)
         layout.addWidget(self.run_button)
 
+        controls = QHBoxLayout()
+        self.pause_button = QPushButton("Pause")
+        self.pause_button.clicked.connect(self.toggle_pause)
+        self.stop_button = QPushButton("Stop")
+        self.stop_button.clicked.connect(self.stop_search)
+        controls.addWidget(self.pause_button)
+        controls.addWidget(self.stop_button)
+        layout.addLayout(controls)
+
         # Visualization placeholder
         self.visual_label = QLabel("Visualization Area")
         self.visual_label.setStyleSheet("background-color: lightgray; min-height: 150px;")
         layout.addWidget(self.visual_label)
 
-        # Current Solution matrix
-        self.solution_matrix = QTableWidget(0, 0)
+        # Current Solution matrix (virtual: only the visible cells are painted)
+        self.board_model = BoardModel()
+        self.solution_matrix = QTableView()
+        self.solution_matrix.setModel(self.board_model)
+        for header in (self.solution_matrix.horizontalHeader(), self.solution_matrix.verticalHeader()):
+            header.setSectionResizeMode(QHeaderView.Fixed)
+            header.setMinimumSectionSize(CELL_SIZE)
+            header.setDefaultSectionSize(CELL_SIZE)
         layout.addWidget(QLabel("Current Solution"))
         layout.addWidget(self.solution_matrix)
 
@@ -53,6 +178,15 @@ class TabuSearchInterface(QWidget):
         self.n = 0
         self.max_iters = 0
         self.iteration = 0
+        self.thread = None
+        self.worker = None
+        self.set_running(False)
+
+    def set_running(self, running):
+        self.run_button.setEnabled(not running)
+        self.pause_button.setEnabled(running)
+        self.stop_button.setEnabled(running)
+        self.pause_button.setText("Pause")
 
     def ask_parameters(self):
         dialog = ParameterDialog()
@@ -67,33 +201,77 @@ class TabuSearchInterface(QWidget):
                 QMessageBox.warning(self, "Error", "Enter valid positive integers.")
                 return
 
-            # Resize solution matrix
-            self.solution_matrix.setRowCount(self.n)
-            self.solution_matrix.setColumnCount(self.n)
-            for i in range(self.n):
-                for j in range(self.n):
-                    self.solution_matrix.setItem(i, j, QTableWidgetItem(""))
+            # Empty board until the worker sends the initial solution
+            self.board_model.set_board([])
 
-            # Start tabu search (animated with timer)
+            # Start tabu search on a worker thread
             self.iteration = 0
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.run_step)
-            self.timer.start(500)  # update every 500ms
+            self.thread = QThread(self)
+            self.worker = TabuSearchWorker(self.n, self.max_iters)
+            self.worker.moveToThread(self.thread)
+            self.thread.started.connect(self.worker.run)
+            self.worker.board_reset.connect(self.show_board)
+            self.worker.progress.connect(self.show_progress)
+            self.worker.finished.connect(self.search_finished)
+            self.worker.finished.connect(self.thread.quit)
+            self.thread.finished.connect(self.worker.deleteLater)
+            self.thread.finished.connect(self.thread_finished)  # before deleteLater: it reads sender()
+            self.thread.finished.connect(self.thread.deleteLater)
+            self.set_running(True)
+            self.thread.start()
 
-    def run_step(self):
-        self.iteration += 1
+    @Slot(object)
+    def show_board(self, rows):
+        self.board_model.set_board(rows)
 
-        self.visual_label.setText(f"Iteration {self.iteration}/{self.max_iters}")
+    @Slot(int, int, int, object)
+    def show_progress(self, iteration, conflicts, best, moved):
+        self.iteration = iteration
+        self.visual_label.setText(f"Iteration {self.iteration}/{self.max_iters}  "
+                                  f"conflicts={conflicts}  best={best}")
+        # only the queens that moved since the last frame are redrawn
+        self.board_model.move_queens(moved)
 
-        # Example: Fill diagonal cells with "Q"
-        if self.iteration <= self.n:
-            self.solution_matrix.setItem(self.iteration-1, self.iteration-1, QTableWidgetItem("Q"))
-
-        # If "solution found"
-        if self.iteration == self.n:
-            self.timer.stop()
+    @Slot(list, int, int)
+    def search_finished(self, solution, conflicts, iterations):
+        self.set_running(False)
+        self.worker = None
+        self.visual_label.setText(f"Iteration {iterations}/{self.max_iters}  conflicts={conflicts}")
+        if conflicts == 0:
             QMessageBox.information(self, "Solution Found",
-                                    f"Solution found at iteration {self.iteration}!")
+                                    f"Solution found at iteration {iterations}!")
+        else:
+            QMessageBox.information(self, "Search Finished",
+                                    f"Best board has {conflicts} attacking pairs after {iterations} iterations.")
+
+    @Slot()
+    def thread_finished(self):
+        # the finished thread deletes itself; forget it unless a newer run already replaced it
+        if self.sender() is self.thread:
+            self.thread = None
+
+    def toggle_pause(self):
+        if self.worker is None:
+            return
+        if self.worker.is_paused():
+            self.worker.resume()
+            self.pause_button.setText("Pause")
+        else:
+            self.worker.pause()
+            self.pause_button.setText("Resume")
+
+    def stop_search(self):
+        if self.worker is not None:
+            self.worker.stop()
+
+    def closeEvent(self, event):
+        if self.thread is not None and self.thread.isRunning():
+            # search_finished clears the worker before the thread has stopped
+            if self.worker is not None:
+                self.worker.stop()
+            self.thread.quit()
+            self.thread.wait()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,181 @@
+"""
+Motor comun de busqueda tabu.
+El ciclo (vecindario, mejor candidato permitido, lista tabu, aspiracion, mejor solucion)
+vive aqui una sola vez; cada problema (n reinas, el ejemplo del arreglo...) solo describe:
+    problema.vecindario(iteracion, tabu)  movimientos candidatos de esta iteracion
+    problema.delta(movimiento)            cambio de costo del movimiento
+    problema.aplicar(movimiento)          aplica el movimiento en sitio
+    problema.atributos(movimiento)        atributos que hacen tabu a un candidato
+    problema.guardarMejor()               guarda la solucion actual como la mejor
+    problema.mejorSolucion()              la mejor solucion en su forma publica
+Opcionales:
+    problema.atributosTabu(movimiento)    atributos que se vuelven tabu al aplicarlo (por defecto atributos)
+    problema.reiniciar()                  nueva solucion inicial; regresa su costo (para paciencia)
+La mejor solucion se guarda solo cuando hace falta: al dejarla por un movimiento que empeora,
+al reiniciar o al terminar, asi mejorar muchas veces seguidas no copia nada.
+Sin observador el motor no imprime ni espera nada (modo sin interfaz).
+"""
+from collections import deque
+import numpy as np
+
+
+class ProblemaTabu:
+    """Base del protocolo: los problemas implementan vecindario, delta, aplicar, atributos y la mejor solucion."""
+
+    def vecindario(self, iteracion, tabu):
+        raise NotImplementedError
+
+    def delta(self, movimiento):
+        raise NotImplementedError
+
+    def aplicar(self, movimiento):
+        raise NotImplementedError
+
+    def atributos(self, movimiento):
+        raise NotImplementedError
+
+    def atributosTabu(self, movimiento):
+        return self.atributos(movimiento)
+
+    def guardarMejor(self):
+        raise NotImplementedError
+
+    def mejorSolucion(self):
+        raise NotImplementedError
+
+    def reiniciar(self):
+        raise NotImplementedError(f"{type(self).__name__} no soporta reinicios")
+
+
+class ListaTabu:
+    """Los ultimos tenencia atributos marcados (deque para el orden, dict para pertenencia en O(1))."""
+
+    def __init__(self, tenencia):
+        self.tenencia = tenencia
+        self._cola = deque()
+        self._veces = {}
+
+    def __contains__(self, atributo):
+        return atributo in self._veces
+
+    def __len__(self):
+        return len(self._cola)
+
+    def esTabu(self, atributos, iteracion):
+        return any(atributo in self._veces for atributo in atributos)
+
+    def marcar(self, atributos, iteracion):
+        for atributo in atributos:
+            self._cola.append(atributo)
+            self._veces[atributo] = self._veces.get(atributo, 0) + 1
+            if len(self._cola) > self.tenencia:
+                viejo = self._cola.popleft()
+                if self._veces[viejo] == 1:
+                    del self._veces[viejo]
+                else:
+                    self._veces[viejo] -= 1
+
+    def limpiar(self):
+        self._cola.clear()
+        self._veces.clear()
+
+
+class VencimientosTabu:
+    """
+    Atributos enteros 0..n-1 con la iteracion en que deja de ser tabu cada uno
+    (arreglo de vencimientos, pertenencia en O(1)). Con rng la tenencia de cada
+    movimiento se sortea entre 1 y tenencia, lo que evita ciclos.
+    """
+
+    def __init__(self, n, tenencia, rng=None):
+        self.tenencia = tenencia
+        self.rng = rng
+        self.tabu_hasta = np.zeros(n, dtype=np.int64)
+
+    def esTabu(self, atributos, iteracion):
+        tabu_hasta = self.tabu_hasta
+        return any(tabu_hasta[atributo] >= iteracion for atributo in atributos)
+
+    def marcar(self, atributos, iteracion):
+        tenencia = self.tenencia if self.rng is None else int(self.rng.integers(1, self.tenencia + 1))
+        for atributo in atributos:
+            self.tabu_hasta[atributo] = iteracion + tenencia
+
+    def limpiar(self):
+        self.tabu_hasta[:] = 0
+
+
+def aspiracionMejora(costo_nuevo, mejor_costo):
+    """Criterio de aspiracion por defecto: un movimiento tabu se permite si mejora la mejor solucion."""
+    return costo_nuevo < mejor_costo
+
+
+def buscar(problema, tabu, iteraciones, costo_inicial, aspiracion=aspiracionMejora, costo_objetivo=None,
+           paciencia=None, observador=None):
+    """
+    Ciclo principal: en cada iteracion toma el candidato de menor delta que no sea tabu
+    (o que cumpla aspiracion(costo_nuevo, mejor_costo); aspiracion=None la desactiva),
+    lo aplica aunque empeore y marca sus atributos en tabu (ListaTabu o VencimientosTabu).
+    Para al llegar a costo_objetivo. Con paciencia, si pasan esas iteraciones sin mejorar
+    se llama problema.reiniciar() y se limpia la lista tabu; la nueva solucion cuenta
+    como candidata a mejor y tambien puede alcanzar costo_objetivo.
+    observador(iteracion, problema, movimiento, costo, mejor_costo) se llama tras cada
+    movimiento (movimiento=None al reiniciar); si regresa False la busqueda se detiene.
+    Regresa (costo_actual, mejor_costo, iteraciones); la mejor solucion queda en
+    problema.mejorSolucion().
+    """
+    costo = costo_inicial
+    mejor_costo = costo_inicial
+    en_mejor = True  # la solucion actual es tan buena como la mejor y aun no se guarda
+    ultima_mejora = 0
+    iteracion = 0
+    delta = problema.delta
+    atributos = problema.atributos
+    esTabu = tabu.esTabu
+    while iteracion < iteraciones and (costo_objetivo is None or mejor_costo > costo_objetivo):
+        iteracion += 1
+        if paciencia is not None and iteracion - ultima_mejora > paciencia:
+            if en_mejor:
+                problema.guardarMejor()
+                en_mejor = False
+            costo = problema.reiniciar()
+            tabu.limpiar()
+            ultima_mejora = iteracion
+            if costo < mejor_costo:
+                mejor_costo = costo
+                en_mejor = True
+            if observador is not None and observador(iteracion, problema, None, costo, mejor_costo) is False:
+                break
+            if costo_objetivo is not None and mejor_costo <= costo_objetivo:
+                break  # el reinicio ya es solucion; no hay vecindario que explorar
+
+        # mejor candidato que no sea tabu o que cumpla la aspiracion
+        elegido = None
+        mejor_delta = None
+        for movimiento in problema.vecindario(iteracion, tabu):
+            diferencia = delta(movimiento)
+            if mejor_delta is not None and diferencia >= mejor_delta:
+                continue
+            if esTabu(atributos(movimiento), iteracion) and (
+                    aspiracion is None or not aspiracion(costo + diferencia, mejor_costo)):
+                continue
+            elegido = movimiento
+            mejor_delta = diferencia
+        if elegido is None:
+            continue
+
+        if en_mejor and mejor_delta > 0:
+            problema.guardarMejor()  # se guarda solo al dejar la mejor solucion
+            en_mejor = False
+        tabu.marcar(problema.atributosTabu(elegido), iteracion)
+        problema.aplicar(elegido)
+        costo += mejor_delta
+        if costo < mejor_costo:
+            mejor_costo = costo
+            ultima_mejora = iteracion
+            en_mejor = True
+        if observador is not None and observador(iteracion, problema, elegido, costo, mejor_costo) is False:
+            break
+    if en_mejor:
+        problema.guardarMejor()
+    return costo, mejor_costo, iteracion
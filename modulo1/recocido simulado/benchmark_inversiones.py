@@ -0,0 +1,79 @@
+"""
+benchmark_inversiones.py
+Comparación del conteo de pares invertidos (costo de desorden):
+calcularCostoDesorden original (doble ciclo, O(n^2))
+contarInversionesFenwick (árbol de Fenwick, O(n log n))
+contarInversionesNumpy (merge sort vectorizado, modo grande)
+
+Métrica:
+Mismo resultado
+Tiempo de ejecución
+
+Casos:
+10^3, 10^5, 10^6 elementos
+El doble ciclo solo se ejecuta hasta LIMITE_CUADRATICO elementos; para tamaños
+mayores se estima su tiempo escalando el tiempo medido por (n / n_medido)^2.
+Semilla fija: 777
+"""
+
+import time
+import numpy as np
+import pandas as pd
+
+from recocidosimulado import calcularCostoDesorden, contarInversionesFenwick, contarInversionesNumpy
+
+SEED = 777
+TAM_ARREGLOS = [10 ** 3, 10 ** 5, 10 ** 6]
+LIMITE_CUADRATICO = 10 ** 4
+
+
+def generar_arreglo(n):
+    rng = np.random.default_rng(SEED)
+    return rng.permutation(n)
+
+
+def medir(funcion, arreglo):
+    t0 = time.perf_counter()
+    resultado = funcion(arreglo)
+    t1 = time.perf_counter()
+    return resultado, t1 - t0
+
+
+if __name__ == "__main__":
+    resultados = []
+    referencia_cuadratica = None  # (n, tiempo) del último doble ciclo medido
+
+    print("\nComparación de conteo de inversiones")
+    print(f"Semilla usada: {SEED}\n")
+
+    for n in TAM_ARREGLOS:
+        print(f"=== {n} elementos ===")
+        arreglo_np = generar_arreglo(n)
+        arreglo_lista = arreglo_np.tolist()
+
+        inv_np, t_np = medir(contarInversionesNumpy, arreglo_np)
+        inv_fw, t_fw = medir(contarInversionesFenwick, arreglo_lista)
+
+        if n <= LIMITE_CUADRATICO:
+            inv_cuad, t_cuad = medir(lambda a: calcularCostoDesorden(a, modo_grande=False), arreglo_lista)
+            referencia_cuadratica = (n, t_cuad)
+            estado_cuad = "MEDIDO"
+        else:
+            inv_cuad = None
+            n_ref, t_ref = referencia_cuadratica
+            t_cuad = t_ref * (n / n_ref) ** 2
+            estado_cuad = "ESTIMADO"
+
+        iguales = inv_np == inv_fw and (inv_cuad is None or inv_cuad == inv_np)
+        print(f"Inversiones={inv_np}  iguales={'SI' if iguales else 'NO'}")
+        print(f"Doble ciclo  -> t={t_cuad:.4f}s ({estado_cuad})")
+        print(f"Fenwick      -> t={t_fw:.4f}s")
+        print(f"NumPy        -> t={t_np:.4f}s  aceleración={t_cuad / t_np:.1f}x\n")
+
+        resultados.append({"Elementos": n, "Inversiones": inv_np, "Iguales": iguales,
+                           "Doble ciclo (s)": t_cuad, "Doble ciclo": estado_cuad,
+                           "Fenwick (s)": t_fw, "NumPy (s)": t_np})
+
+    print("\n Tabla comparativa:\n")
+    df = pd.DataFrame(resultados)
+    print(df.to_string(index=False))
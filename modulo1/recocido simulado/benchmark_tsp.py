@@ -0,0 +1,139 @@
+"""
+benchmark_tsp.py
+Comparación de variantes de vvrs.recocidoSimulado sobre instancias del TSP:
+mezcla (swap + 2-opt + Or-opt, esquema fijo)
+solo_swap (solo swaps, esquema fijo)
+lotes_256 (swaps evaluados en lotes de 256 con NumPy, esquema fijo)
+mezcla_adaptativo (mezcla con EsquemaAdaptativo)
+
+Métrica:
+Costo encontrado y gap contra el óptimo conocido (%)
+Tiempo de ejecución
+Propuestas por segundo
+Memoria pico (RSS del proceso y lo que creció durante la corrida)
+
+Casos:
+instancias TSPLIB de la carpeta instancias/ (o las rutas .tsp pasadas como argumentos)
+instancias aleatorias EUC_2D de TAM_ALEATORIAS ciudades (sin óptimo conocido)
+Las variantes con esquema fijo solo se corren hasta MAX_CIUDADES_ESQUEMA_FIJO ciudades.
+Cada caso corre en un proceso nuevo para que la memoria y el tiempo no se mezclen.
+La tabla se guarda en RUTA_RESULTADOS para compararla entre versiones.
+Semilla fija: 777
+"""
+
+import glob
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+from esquema_temperatura import EsquemaAdaptativo, EsquemaFijo
+from tsplib import leerTsplib, matrizTsplib
+import vvrs
+
+SEED = 777
+CARPETA_INSTANCIAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "instancias")
+TAM_ALEATORIAS = [100]
+MAX_CIUDADES_ESQUEMA_FIJO = 50
+RUTA_RESULTADOS = "benchmark_tsp.csv"
+
+# óptimos publicados de TSPLIB (longitud entera del mejor recorrido)
+OPTIMOS_CONOCIDOS = {
+    "burma14": 3323, "ulysses16": 6859, "ulysses22": 7013, "att48": 10628, "eil51": 426,
+    "berlin52": 7542, "st70": 675, "eil76": 538, "pr76": 108159, "kroA100": 21282,
+    "eil101": 629, "ch130": 6110, "ch150": 6528, "a280": 2579,
+}
+
+VARIANTES = {
+    "mezcla": {"esquema": EsquemaFijo},
+    "solo_swap": {"esquema": EsquemaFijo, "operadores": {"swap": 1.0}},
+    "lotes_256": {"esquema": EsquemaFijo, "tam_lote": 256},
+    "mezcla_adaptativo": {"esquema": EsquemaAdaptativo},
+}
+
+
+def cargar_instancias(rutas):
+    """(nombre, matriz, óptimo o None) de cada .tsp y de las instancias aleatorias."""
+    instancias = []
+    for ruta in rutas:
+        instancia = leerTsplib(ruta)
+        nombre = os.path.splitext(os.path.basename(instancia["nombre"]))[0]
+        instancias.append((nombre, matrizTsplib(instancia), OPTIMOS_CONOCIDOS.get(nombre)))
+    for n in TAM_ALEATORIAS:
+        rng = np.random.default_rng(SEED)
+        coordenadas = rng.uniform(0, 1000, size=(n, 2))
+        matriz = np.floor(vvrs.construirMatrizDistancias(coordenadas) + 0.5)  # EUC_2D
+        instancias.append((f"aleatoria{n}", matriz, None))
+    return instancias
+
+
+def memoria_pico_mb():
+    """RSS máximo del proceso en MB (None si la plataforma no tiene el módulo resource)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 2 ** 20 if sys.platform == "darwin" else pico / 2 ** 10
+
+
+def correr_caso(matriz, variante):
+    """Corre una variante en este proceso. Regresa (costo, segundos, propuestas, memoria pico, memoria extra)."""
+    opciones = dict(VARIANTES[variante])
+    clase_esquema = opciones.pop("esquema")
+    esquemas = []
+
+    def esquema(**parametros):
+        esquemas.append(clase_esquema(**parametros))
+        return esquemas[-1]
+
+    random.seed(SEED)
+    np.random.seed(SEED)
+    memoria_inicial = memoria_pico_mb()
+    t0 = time.perf_counter()
+    recorrido, costo = vvrs.recocidoSimulado(matriz, esquema=esquema, verboso=False, **opciones)
+    t1 = time.perf_counter()
+    memoria_final = memoria_pico_mb()
+
+    costo_verificado = vvrs.calcularDistanciaTotal(recorrido, matriz)
+    if abs(costo_verificado - costo) > 1e-6 * max(1.0, abs(costo)):
+        raise AssertionError(f"costo reportado {costo} != costo del recorrido {costo_verificado}")
+    propuestas = esquemas[0].nivel * vvrs.parametrosRecocido(len(matriz))["iteraciones_por_nivel"]
+    extra = None if memoria_inicial is None else memoria_final - memoria_inicial
+    return float(costo_verificado), t1 - t0, propuestas, memoria_final, extra
+
+
+if __name__ == "__main__":
+    rutas = sys.argv[1:] or sorted(glob.glob(os.path.join(CARPETA_INSTANCIAS, "*.tsp")))
+    resultados = []
+
+    print("\nBenchmark del recocido simulado para el TSP")
+    print(f"Semilla usada: {SEED}\n")
+
+    for nombre, matriz, optimo in cargar_instancias(rutas):
+        n = len(matriz)
+        print(f"=== {nombre} ({n} ciudades, óptimo={optimo}) ===")
+        for variante, opciones in VARIANTES.items():
+            if opciones["esquema"] is EsquemaFijo and n > MAX_CIUDADES_ESQUEMA_FIJO:
+                resultados.append({"Instancia": nombre, "Ciudades": n, "Variante": variante, "Estado": "OMITIDA"})
+                continue
+            # un proceso nuevo por caso: memoria pico y tiempo sin residuos de otros casos
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                costo, t, propuestas, memoria, extra = pool.submit(correr_caso, matriz, variante).result()
+            gap = None if optimo is None else 100.0 * (costo - optimo) / optimo
+            print(f"{variante:<18}-> costo={costo:.0f}  gap={'-' if gap is None else f'{gap:.2f}%'}  "
+                  f"t={t:.2f}s  propuestas/s={propuestas / t:,.0f}")
+            resultados.append({"Instancia": nombre, "Ciudades": n, "Variante": variante, "Estado": "OK",
+                               "Costo": costo, "Óptimo": optimo, "Gap (%)": gap, "Tiempo (s)": t,
+                               "Propuestas": propuestas, "Propuestas/s": propuestas / t,
+                               "Memoria pico (MB)": memoria, "Memoria extra (MB)": extra})
+        print()
+
+    print("\n Tabla comparativa:\n")
+    df = pd.DataFrame(resultados)
+    print(df.to_string(index=False))
+    df.to_csv(RUTA_RESULTADOS, index=False)
+    print(f"\nResultados guardados en {RUTA_RESULTADOS}")
@@ -0,0 +1,206 @@
+"""
+Esquemas de temperatura para el recocido simulado.
+Un esquema decide la temperatura de cada nivel y cuándo termina el recocido:
+    esquema.temperatura   temperatura del nivel que se va a explorar
+    esquema.fase          CALENTAMIENTO, PICO_TEMPERATURA o ENFRIAMIENTO
+    esquema.registrarNivel(aceptados, propuestos, mejor_costo)
+                          se llama al terminar cada nivel, avanza el esquema y
+                          regresa True si el recocido debe terminar
+    esquema.resumen()     niveles usados, niveles que usaría el esquema fijo,
+                          niveles ahorrados y motivo de paro
+Los recocidos reciben la clase (o una función que construya el esquema) y la
+llaman con los parámetros del problema, así se puede cambiar de esquema sin
+tocar el ciclo principal.
+"""
+import math
+import time
+
+
+class EsquemaFijo:
+    """
+    El esquema original de tres fases con factores fijos:
+    1. calentamiento gradual hasta temp_maxima.
+    2. iteraciones_en_pico niveles en temperatura máxima.
+    3. enfriamiento gradual hasta bajar de temp_minima.
+    """
+    def __init__(self, temp_de_arranque, temp_maxima, temp_minima, factor_calentamiento,
+                 iteraciones_en_pico, factor_enfriamiento):
+        self.temp_de_arranque = temp_de_arranque
+        self.temp_maxima = temp_maxima
+        self.temp_minima = temp_minima
+        self.factor_calentamiento = factor_calentamiento
+        self.iteraciones_en_pico = iteraciones_en_pico
+        self.factor_enfriamiento = factor_enfriamiento
+
+        self.fase = "CALENTAMIENTO"
+        self.temperatura = temp_de_arranque
+        self.contador_pico = 0
+        self.nivel = 0
+        self.terminado = False
+        self.motivo_paro = None
+
+    def registrarNivel(self, aceptados=None, propuestos=None, mejor_costo=None):
+        """Lógica de transición de fases y temperatura al terminar un nivel."""
+        self.nivel += 1
+        if self.fase == "CALENTAMIENTO":
+            self.temperatura *= self.factor_calentamiento
+            if self.temperatura >= self.temp_maxima:
+                self.temperatura = self.temp_maxima
+                self.fase = "PICO_TEMPERATURA"
+
+        elif self.fase == "PICO_TEMPERATURA":
+            self.contador_pico += 1
+            if self.contador_pico >= self.iteraciones_en_pico:
+                self.fase = "ENFRIAMIENTO"
+
+        elif self.fase == "ENFRIAMIENTO":
+            self.temperatura *= self.factor_enfriamiento
+            if self.temperatura < self.temp_minima:
+                self.detener("temperatura_minima")
+        return self.terminado
+
+    def detener(self, motivo):
+        """Marca el esquema como terminado, p. ej. cuando el problema encontró el óptimo."""
+        self.terminado = True
+        self.motivo_paro = motivo
+
+    def estado(self):
+        """Variables que cambian durante el recocido (para puntos de control)."""
+        return {
+            "fase": self.fase,
+            "temperatura": self.temperatura,
+            "contador_pico": self.contador_pico,
+            "nivel": self.nivel,
+            "terminado": self.terminado,
+            "motivo_paro": self.motivo_paro,
+        }
+
+    def restaurar(self, estado):
+        """Regresa el esquema al punto guardado con estado()."""
+        for clave, valor in estado.items():
+            setattr(self, clave, valor)
+
+    def nivelesEsquemaFijo(self):
+        """Niveles que recorre el esquema fijo completo (forma cerrada, sin simularlo)."""
+        if self.temp_de_arranque >= self.temp_maxima:
+            calentamiento = 1
+        else:
+            calentamiento = max(1, math.ceil(math.log(self.temp_maxima / self.temp_de_arranque)
+                                             / math.log(self.factor_calentamiento)))
+        pico = max(1, self.iteraciones_en_pico)
+        enfriamiento = math.floor(math.log(self.temp_maxima / self.temp_minima)
+                                  / -math.log(self.factor_enfriamiento)) + 1
+        return calentamiento + pico + enfriamiento
+
+    def resumen(self):
+        """Niveles usados contra los del esquema fijo y motivo de paro."""
+        niveles_fijos = self.nivelesEsquemaFijo()
+        return {
+            "niveles": self.nivel,
+            "niveles_esquema_fijo": niveles_fijos,
+            "niveles_ahorrados": max(0, niveles_fijos - self.nivel),
+            "motivo_paro": self.motivo_paro,
+        }
+
+
+class EsquemaAdaptativo(EsquemaFijo):
+    """
+    Mismo esquema de tres fases, pero guiado por la tasa de aceptación y por las mejoras:
+    - el calentamiento se detiene en cuanto la tasa de aceptación llega a aceptacion_pico
+      (ya está suficientemente caliente), aunque no se haya llegado a temp_maxima.
+    - el pico se abandona tras ventana_pico niveles sin mejorar el mejor costo.
+    - al enfriar, si la tasa supera aceptacion_objetivo se enfría más rápido
+      (el factor se eleva a aceleracion_enfriamiento).
+    - si ya se enfrió (tasa <= aceptacion_objetivo) y el mejor costo no mejora en
+      ventana_estancamiento niveles se recalienta (temperatura * factor_recalentamiento)
+      hasta max_recalentamientos veces; después se para.
+    - tiempo_limite (segundos) corta el recocido sin importar la fase.
+    """
+    def __init__(self, temp_de_arranque, temp_maxima, temp_minima, factor_calentamiento,
+                 iteraciones_en_pico, factor_enfriamiento, aceptacion_pico=0.9,
+                 aceptacion_objetivo=0.2, aceleracion_enfriamiento=4.0, ventana_pico=20,
+                 ventana_estancamiento=200, factor_recalentamiento=10.0, max_recalentamientos=2,
+                 tiempo_limite=None):
+        super().__init__(temp_de_arranque, temp_maxima, temp_minima, factor_calentamiento,
+                         iteraciones_en_pico, factor_enfriamiento)
+        self.aceptacion_pico = aceptacion_pico
+        self.aceptacion_objetivo = aceptacion_objetivo
+        self.aceleracion_enfriamiento = aceleracion_enfriamiento
+        self.ventana_pico = ventana_pico
+        self.ventana_estancamiento = ventana_estancamiento
+        self.factor_recalentamiento = factor_recalentamiento
+        self.max_recalentamientos = max_recalentamientos
+        self.tiempo_limite = tiempo_limite
+
+        self.mejor_costo = math.inf
+        self.niveles_sin_mejora = 0
+        self.recalentamientos = 0
+        self.inicio = time.perf_counter()
+
+    def registrarNivel(self, aceptados=None, propuestos=None, mejor_costo=None):
+        """Avanza un nivel usando la tasa de aceptación y el historial del mejor costo."""
+        self.nivel += 1
+        tasa = aceptados / propuestos if aceptados is not None and propuestos else None
+        if mejor_costo is not None and mejor_costo < self.mejor_costo:
+            self.mejor_costo = mejor_costo
+            self.niveles_sin_mejora = 0
+        else:
+            self.niveles_sin_mejora += 1
+
+        if self.tiempo_limite is not None and time.perf_counter() - self.inicio >= self.tiempo_limite:
+            self.detener("tiempo_limite")
+            return self.terminado
+
+        if self.fase == "CALENTAMIENTO":
+            self.temperatura *= self.factor_calentamiento
+            if self.temperatura >= self.temp_maxima or (tasa is not None and tasa >= self.aceptacion_pico):
+                self.temperatura = min(self.temperatura, self.temp_maxima)
+                self.fase = "PICO_TEMPERATURA"
+                # la ventana del pico cuenta desde que empieza el pico, no desde el calentamiento
+                self.contador_pico = 0
+                self.niveles_sin_mejora = 0
+
+        elif self.fase == "PICO_TEMPERATURA":
+            self.contador_pico += 1
+            if self.contador_pico >= self.iteraciones_en_pico or self.niveles_sin_mejora >= self.ventana_pico:
+                self.fase = "ENFRIAMIENTO"
+                self.niveles_sin_mejora = 0
+
+        elif self.fase == "ENFRIAMIENTO":
+            factor = self.factor_enfriamiento
+            if tasa is not None and tasa > self.aceptacion_objetivo:
+                # todavía acepta demasiado: se enfría más rápido y no cuenta como estancamiento
+                factor = factor ** self.aceleracion_enfriamiento
+                self.niveles_sin_mejora = 0
+            self.temperatura *= factor
+            if self.niveles_sin_mejora >= self.ventana_estancamiento:
+                if self.recalentamientos < self.max_recalentamientos:
+                    self.recalentamientos += 1
+                    self.temperatura = min(self.temp_maxima, self.temperatura * self.factor_recalentamiento)
+                    self.niveles_sin_mejora = 0
+                else:
+                    self.detener("sin_mejora")
+            elif self.temperatura < self.temp_minima:
+                self.detener("temperatura_minima")
+        return self.terminado
+
+    def estado(self):
+        """Agrega el historial de mejoras y el tiempo ya usado (el reloj sigue al restaurar)."""
+        datos = super().estado()
+        datos["mejor_costo"] = self.mejor_costo
+        datos["niveles_sin_mejora"] = self.niveles_sin_mejora
+        datos["recalentamientos"] = self.recalentamientos
+        datos["segundos"] = time.perf_counter() - self.inicio
+        return datos
+
+    def restaurar(self, estado):
+        estado = dict(estado)
+        self.inicio = time.perf_counter() - estado.pop("segundos")
+        super().restaurar(estado)
+
+    def resumen(self):
+        """Agrega al resumen los recalentamientos y el tiempo usado."""
+        datos = super().resumen()
+        datos["recalentamientos"] = self.recalentamientos
+        datos["segundos"] = time.perf_counter() - self.inicio
+        return datos
@@ -0,0 +1,77 @@
+"""
+Construcción de matrices de distancias euclidianas para el TSP.
+En lugar del doble ciclo con np.linalg.norm, las filas se calculan por bloques con
+broadcasting; cada bloque ocupa a lo mucho ELEMENTOS_POR_BLOQUE valores temporales,
+así que la memoria extra no depende del número de ciudades.
+La matriz puede salir en float32 (la mitad de memoria) y escribirse directo a un
+archivo .npy mapeado en memoria, para calcular una vez las instancias grandes y
+abrirlas después sin cargarlas completas (abrirMatrizDistancias).
+"""
+import numpy as np
+
+ELEMENTOS_POR_BLOQUE = 4_000_000
+
+
+def construirMatrizDistancias(coordenadas, tipo=np.float64, filas_por_bloque=None, ruta=None):
+    """
+    Matriz NxN de distancias euclidianas entre las coordenadas (N, d).
+    :param tipo: tipo de la matriz de salida, p. ej. np.float32
+    :param filas_por_bloque: filas calculadas a la vez (por defecto según ELEMENTOS_POR_BLOQUE)
+    :param ruta: si se da, la matriz se escribe en ese archivo .npy con np.memmap
+    """
+    coordenadas = np.asarray(coordenadas, dtype=np.float64)
+    if coordenadas.ndim == 1:
+        coordenadas = coordenadas[:, None]
+    n = len(coordenadas)
+    if filas_por_bloque is None:
+        filas_por_bloque = max(1, ELEMENTOS_POR_BLOQUE // max(n, 1))
+
+    if ruta is None:
+        matriz = np.empty((n, n), dtype=tipo)
+    else:
+        matriz = np.lib.format.open_memmap(ruta, mode="w+", dtype=tipo, shape=(n, n))
+
+    for inicio in range(0, n, filas_por_bloque):
+        fin = min(inicio + filas_por_bloque, n)
+        cuadrados = np.zeros((fin - inicio, n))
+        for eje in range(coordenadas.shape[1]):
+            diferencia = coordenadas[inicio:fin, eje][:, None] - coordenadas[:, eje][None, :]
+            cuadrados += diferencia * diferencia
+        matriz[inicio:fin] = np.sqrt(cuadrados)
+
+    if ruta is not None:
+        matriz.flush()
+    return matriz
+
+
+def abrirMatrizDistancias(ruta, modo="r"):
+    """
+    Abre una matriz guardada en .npy sin cargarla: se lee del disco bajo demanda.
+    Se regresa como ndarray (sobre el mismo mapa de memoria) porque indexar un
+    np.memmap elemento por elemento es varias veces más lento.
+    """
+    return np.asarray(np.load(ruta, mmap_mode=modo))
+
+
+def esSimetrica(matriz, filas_por_bloque=None):
+    """Revisa la simetría por bloques de filas, sin crear la transpuesta completa en memoria."""
+    n = len(matriz)
+    if filas_por_bloque is None:
+        filas_por_bloque = max(1, ELEMENTOS_POR_BLOQUE // max(n, 1))
+    matriz = np.asarray(matriz)
+    for inicio in range(0, n, filas_por_bloque):
+        fin = min(inicio + filas_por_bloque, n)
+        if not np.allclose(matriz[inicio:fin], matriz[:, inicio:fin].T):
+            return False
+    return True
+
+
+def copiarPorBloques(origen, destino, filas_por_bloque=None):
+    """Copia origen en destino (mismo tamaño) por bloques de filas; un memmap nunca se carga completo."""
+    n = len(origen)
+    if filas_por_bloque is None:
+        filas_por_bloque = max(1, ELEMENTOS_POR_BLOQUE // max(n, 1))
+    for inicio in range(0, n, filas_por_bloque):
+        fin = min(inicio + filas_por_bloque, n)
+        destino[inicio:fin] = origen[inicio:fin]
+    return destino
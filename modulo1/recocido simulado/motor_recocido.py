@@ -0,0 +1,170 @@
+"""
+Motor común del recocido simulado.
+El ciclo de calentamiento, pico y enfriamiento vive aquí una sola vez; cada problema
+(ordenamiento, TSP, rutas de CEDIS...) solo describe sus movimientos:
+    problema.proponer()          movimiento aleatorio, o None si no hay uno válido
+    problema.delta(movimiento)   cambio de costo del movimiento
+    problema.aplicar(movimiento) aplica el movimiento en sitio
+    problema.deshacer(movimiento) revierte un movimiento aplicado
+    problema.guardarMejor()      guarda la solución actual como la mejor (sin reservar memoria si se puede)
+    problema.mejorSolucion()     la mejor solución en su forma pública (listas)
+Opcionales:
+    problema.DELTA_APLICA        True si delta() deja el movimiento aplicado (aplicar-medir);
+                                 el motor llama deshacer() al rechazarlo y no llama aplicar()
+    problema.estado()/restaurar(estado)  arreglos de la solución para los puntos de control
+    problema.explorarNivel(...)  reemplaza la exploración movimiento por movimiento (p. ej. lotes)
+Los umbrales de Metropolis se sortean por bloques con NumPy (-T ln u, aceptar si delta < umbral,
+equivalente a random() < exp(-delta / T)), no se copia ninguna solución salvo al mejorar, y el
+reporte por nivel se puede muestrear con cada_reporte.
+"""
+import os
+import numpy as np
+from puntos_control import cargarPuntoControl, guardarPuntoControl
+
+TAM_BLOQUE_UMBRALES = 4096  # umbrales de aceptación sorteados a la vez
+
+
+class ProblemaRecocido:
+    """Base del protocolo: los problemas implementan proponer, delta, aplicar, deshacer y la mejor solución."""
+    DELTA_APLICA = False
+
+    def proponer(self):
+        raise NotImplementedError
+
+    def delta(self, movimiento):
+        raise NotImplementedError
+
+    def aplicar(self, movimiento):
+        raise NotImplementedError
+
+    def deshacer(self, movimiento):
+        raise NotImplementedError
+
+    def guardarMejor(self):
+        raise NotImplementedError
+
+    def mejorSolucion(self):
+        raise NotImplementedError
+
+    def estado(self):
+        raise NotImplementedError(f"{type(self).__name__} no soporta puntos de control")
+
+    def restaurar(self, estado):
+        raise NotImplementedError(f"{type(self).__name__} no soporta puntos de control")
+
+
+def explorarNivel(problema, costo_actual, mejor_costo, temp_actual, iteraciones, costo_objetivo=None):
+    """
+    Explora un nivel de temperatura con iteraciones propuestas.
+    Si se alcanza costo_objetivo el nivel termina antes.
+    Regresa (costo_actual, mejor_costo, aceptados).
+    """
+    propio = getattr(problema, "explorarNivel", None)
+    if propio is not None:
+        return propio(costo_actual, mejor_costo, temp_actual, iteraciones)
+    proponer = problema.proponer
+    calcularDelta = problema.delta
+    aplicar = problema.aplicar
+    deshacer = problema.deshacer
+    delta_aplica = problema.DELTA_APLICA
+    aceptados = 0
+    restantes = iteraciones
+    while restantes > 0:
+        k = min(TAM_BLOQUE_UMBRALES, restantes)
+        restantes -= k
+        umbrales = (-temp_actual * np.log(1.0 - np.random.random(k))).tolist()
+        for umbral in umbrales:
+            movimiento = proponer()
+            if movimiento is None:
+                continue
+            diferencia_costo = calcularDelta(movimiento)
+            if diferencia_costo < umbral:
+                if not delta_aplica:
+                    aplicar(movimiento)
+                costo_actual += diferencia_costo
+                aceptados += 1
+                if costo_actual < mejor_costo:
+                    mejor_costo = costo_actual
+                    problema.guardarMejor()
+                    if costo_objetivo is not None and mejor_costo <= costo_objetivo:
+                        return costo_actual, mejor_costo, aceptados
+            elif delta_aplica:
+                deshacer(movimiento)
+    return costo_actual, mejor_costo, aceptados
+
+
+def reporteNivel(iteracion, control, costo_anterior, costo_actual, mejor_costo):
+    """Reporte por defecto de cada nivel."""
+    print(f"Iteración {iteracion:3}: Fase={control.fase:<18} Temp={control.temperatura:9.3f}, Costo Actual={costo_actual:8.2f}, Mejor Costo={mejor_costo:8.2f}")
+
+
+def recocer(problema, control, costo_inicial, iteraciones_por_nivel, traza=None, verboso=True,
+            reporte=reporteNivel, cada_reporte=1, costo_objetivo=None, punto_control=None, cada_niveles=50,
+            n=None, huella=None):
+    """
+    Ciclo principal: explora un nivel, lo registra en la traza, avanza el esquema
+    (control, p. ej. EsquemaFijo) y reporta, hasta que el esquema termine.
+    reporte(iteracion, control, costo_anterior, costo_actual, mejor_costo) se llama
+    cada cada_reporte niveles si verboso.
+    Con costo_objetivo el recocido para en cuanto el mejor costo lo alcanza (motivo "optimo").
+    Con punto_control se guarda el estado cada cada_niveles niveles y, si el archivo
+    ya existe, se reanuda desde ahí igual que si nunca se hubiera detenido. n (tamaño
+    del problema) y huella (p. ej. puntos_control.huellaArreglo de la matriz de costos)
+    se guardan en el archivo y se comparan al reanudar: un punto de control de otra
+    instancia lanza ValueError. Al terminar el recocido el archivo se borra, así una
+    corrida terminada nunca se reanuda.
+    Regresa (costo_actual, mejor_costo); la mejor solución queda en problema.mejorSolucion().
+    """
+    costo_actual = costo_inicial
+    mejor_costo = costo_inicial
+    iteracion = 1
+    if punto_control is not None and os.path.exists(punto_control):
+        estado = cargarPuntoControl(punto_control)
+        if n is not None and estado.get("n") != n:
+            raise ValueError(f"El punto de control {punto_control} es de un problema de n={estado.get('n')}, "
+                             f"no de n={n}")
+        if huella is not None and estado.get("huella") != huella:
+            raise ValueError(f"El punto de control {punto_control} es de otra instancia "
+                             f"(la huella de los datos no coincide)")
+        problema.restaurar(estado)
+        control.restaurar(estado["esquema"])
+        costo_actual = estado["costo_actual"]
+        mejor_costo = estado["mejor_costo"]
+        iteracion = estado["iteracion"]
+        if verboso:
+            print(f"Reanudando desde {punto_control} en el nivel {iteracion}")
+
+    while True:
+        costo_anterior = costo_actual
+        temp_actual = control.temperatura
+        costo_actual, mejor_costo, aceptados = explorarNivel(
+            problema, costo_actual, mejor_costo, temp_actual, iteraciones_por_nivel, costo_objetivo)
+        if traza is not None:
+            traza.registrar(iteracion, control.fase, temp_actual, costo_actual, mejor_costo,
+                            aceptados / iteraciones_por_nivel)
+
+        if costo_objetivo is not None and mejor_costo <= costo_objetivo:
+            control.detener("optimo")
+            if verboso and reporte is not None:
+                reporte(iteracion, control, costo_anterior, costo_actual, mejor_costo)
+            break
+        if control.registrarNivel(aceptados, iteraciones_por_nivel, mejor_costo):
+            break
+        if verboso and reporte is not None and iteracion % cada_reporte == 0:
+            reporte(iteracion, control, costo_anterior, costo_actual, mejor_costo)
+        iteracion += 1
+
+        if punto_control is not None and iteracion % cada_niveles == 0:
+            estado = problema.estado()
+            estado.update({"costo_actual": costo_actual, "mejor_costo": mejor_costo,
+                           "esquema": control.estado(), "iteracion": iteracion, "n": n,
+                           "huella": huella})
+            guardarPuntoControl(punto_control, estado)
+
+    if punto_control is not None and os.path.exists(punto_control):
+        os.remove(punto_control)  # corrida terminada: no hay nada que reanudar
+    if verboso:
+        resumen = control.resumen()
+        print(f"Niveles: {resumen['niveles']} (esquema fijo: {resumen['niveles_esquema_fijo']}, "
+              f"ahorrados: {resumen['niveles_ahorrados']}), motivo de paro: {resumen['motivo_paro']}")
+    return costo_actual, mejor_costo
@@ -0,0 +1,98 @@
+"""
+Puntos de control para recocidos largos.
+El estado se guarda en un archivo .npz: los arreglos (recorridos, rutas) como
+arreglos de NumPy y los valores sueltos (costos, temperatura, fase, nivel...) como
+JSON dentro del mismo archivo. También se guardan los estados de random y de
+np.random, así un recocido reanudado sigue exactamente la misma secuencia que
+uno que nunca se detuvo.
+La escritura es atómica (archivo temporal + os.replace): si el proceso muere a
+media escritura queda el punto de control anterior.
+"""
+import hashlib
+import json
+import os
+import random
+import numpy as np
+
+
+def guardarPuntoControl(ruta, estado):
+    """
+    Guarda estado (dict) en ruta junto con el estado de los generadores aleatorios.
+    Los valores np.ndarray y los escalares de NumPy se guardan como arreglos (conservan
+    su tipo, p. ej. un costo float32); el resto debe ser serializable a JSON.
+    """
+    arreglos = {}
+    meta = {}
+    for clave, valor in estado.items():
+        if isinstance(valor, (np.ndarray, np.generic)):
+            arreglos[clave] = np.asarray(valor)
+        else:
+            meta[clave] = valor
+
+    version, estado_mt, gauss = random.getstate()
+    arreglos["_random_mt"] = np.array(estado_mt, dtype=np.uint32)
+    meta["_random_version"] = version
+    meta["_random_gauss"] = gauss
+    nombre, llaves, pos, tiene_gauss, gauss_cache = np.random.get_state()
+    arreglos["_numpy_llaves"] = llaves
+    meta["_numpy"] = [nombre, int(pos), int(tiene_gauss), float(gauss_cache)]
+    arreglos["_meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "wb") as archivo:
+        np.savez_compressed(archivo, **arreglos)
+    os.replace(temporal, ruta)
+
+
+def cargarPuntoControl(ruta, restaurar_generadores=True):
+    """
+    Lee un punto de control y regresa el dict de estado (arreglos como np.ndarray,
+    escalares de NumPy con su tipo original).
+    Con restaurar_generadores=True deja random y np.random como estaban al guardar.
+    """
+    with np.load(ruta) as datos:
+        arreglos = {clave: datos[clave] for clave in datos.files}
+    meta = json.loads(arreglos.pop("_meta").tobytes().decode("utf-8"))
+    estado_mt = arreglos.pop("_random_mt")
+    llaves = arreglos.pop("_numpy_llaves")
+    version = meta.pop("_random_version")
+    gauss = meta.pop("_random_gauss")
+    nombre, pos, tiene_gauss, gauss_cache = meta.pop("_numpy")
+    if restaurar_generadores:
+        random.setstate((version, tuple(int(x) for x in estado_mt), gauss))
+        np.random.set_state((nombre, llaves, pos, tiene_gauss, gauss_cache))
+    for clave, valor in arreglos.items():
+        meta[clave] = valor[()] if valor.ndim == 0 else valor
+    return meta
+
+
+def huellaArreglo(arreglo, filas_por_bloque=1024):
+    """
+    Huella (sha1 en hexadecimal) de la forma, el tipo y el contenido de un arreglo, para
+    reconocer la instancia de un punto de control. Se lee por bloques de filas, así una
+    matriz mapeada en memoria no se carga completa.
+    """
+    arreglo = np.asarray(arreglo)
+    huella = hashlib.sha1(f"{arreglo.shape}{arreglo.dtype.str}".encode("utf-8"))
+    if arreglo.ndim == 0:
+        huella.update(arreglo.tobytes())
+    for inicio in range(0, len(arreglo) if arreglo.ndim else 0, filas_por_bloque):
+        huella.update(np.ascontiguousarray(arreglo[inicio:inicio + filas_por_bloque]).tobytes())
+    return huella.hexdigest()
+
+
+def aplanarRutas(rutas):
+    """Convierte una lista de rutas (listas) en (valores, largos) para guardarlas como arreglos."""
+    valores = np.array([punto for ruta in rutas for punto in ruta], dtype=np.int32)
+    largos = np.array([len(ruta) for ruta in rutas], dtype=np.int32)
+    return valores, largos
+
+
+def rutasDesdeArreglos(valores, largos):
+    """Inverso de aplanarRutas."""
+    rutas = []
+    inicio = 0
+    for largo in largos.tolist():
+        rutas.append(valores[inicio:inicio + largo].tolist())
+        inicio += largo
+    return rutas
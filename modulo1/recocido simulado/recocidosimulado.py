@@ -1,12 +1,24 @@
 import math
 import random
+from bisect import bisect_left, bisect_right, insort
 import numpy as np
+from esquema_temperatura import EsquemaFijo
+from motor_recocido import ProblemaRecocido, recocer
 
+# a partir de este tamaño el doble ciclo es demasiado lento y se usa el conteo O(n log n)
+UMBRAL_ARREGLO_GRANDE = 2000
 
-def calcularCostoDesorden(arreglo):
+
+def calcularCostoDesorden(arreglo, modo_grande=None):
     """Calcula el costo (desorden) de un arreglo. Un arreglo ordenado tiene costo 0.
      Este se calcula Por Pares invertidos suman costo cada par invertido.
+     modo_grande=True usa el conteo por mezcla con NumPy (O(n log n)); si es None
+     se activa solo cuando el arreglo supera UMBRAL_ARREGLO_GRANDE elementos.
     """
+    if modo_grande is None:
+        modo_grande = len(arreglo) > UMBRAL_ARREGLO_GRANDE
+    if modo_grande:
+        return contarInversionesNumpy(arreglo)
     costo = 0
     n = len(arreglo)
     for i in range(n):
@@ -16,95 +28,256 @@ def calcularCostoDesorden(arreglo):
     return costo
 
 
-def recocidoSimulado(problema_inicial):
+def contarInversionesNumpy(arreglo):
     """
-    implementa el recocido simulado:
-    1. calentamiento gradual.
-    2. mantenimiento en temperatura máxima.
-    3. enfriamiento gradual.
+    Cuenta los pares invertidos de un arreglo (lista o arreglo de NumPy) con un
+    merge sort vectorizado de abajo hacia arriba.
+    En cada nivel se juntan pares de bloques vecinos de tamaño ancho y, para
+    cada elemento del bloque derecho, se cuentan con searchsorted los elementos
+    del bloque izquierdo que son mayores. Todo el nivel se resuelve en NumPy.
     """
-    n = len(problema_inicial)
-    solucion_actual = list(problema_inicial)
-    costo_actual = calcularCostoDesorden(solucion_actual)
-    mejor_solucion = list(solucion_actual)
-    mejor_costo = costo_actual
+    valores = np.asarray(arreglo)
+    n = valores.size
+    if n < 2:
+        return 0
+    # rango único por elemento; el orden estable hace que los iguales no cuenten como invertidos
+    rango = np.empty(n, dtype=np.int64)
+    rango[np.argsort(valores, kind="stable")] = np.arange(n, dtype=np.int64)
+    posiciones = np.arange(n, dtype=np.int64)
+    inversiones = 0
+    ancho = 1
+    while ancho < n:
+        grupo = posiciones // (2 * ancho)
+        es_izquierdo = (posiciones // ancho) % 2 == 0
+        # clave = grupo * n + rango deja los bloques izquierdos ordenados y separados por grupo
+        claves_izquierda = np.sort(grupo[es_izquierdo] * n + rango[es_izquierdo])
+        grupo_der = grupo[~es_izquierdo]
+        rango_der = rango[~es_izquierdo]
+        mayores = (np.searchsorted(claves_izquierda, (grupo_der + 1) * n, side="left")
+                   - np.searchsorted(claves_izquierda, grupo_der * n + rango_der, side="right"))
+        inversiones += int(mayores.sum())
+        ancho *= 2
+    return inversiones
 
-    print(f"Solución Inicial (Arreglo Desordenado): {solucion_actual}")
-    print(f"Costo Inicial (Desorden): {costo_actual:.2f}\n")
 
-    # parámetros de la simulación
-    temp_de_arranque = float(n) / 4
-    temp_maxima = float(n * 10)
-    temp_minima = 1e-5
-    iteraciones_por_nivel = n * 10
-    factor_calentamiento = 1.02 #
-    iteraciones_en_pico = n * 10 # cuando ya está caliente
-    factor_enfriamiento = 1.0 - (1.0 / (n * 10.0))
-
-    # control de fases
-    estado_actual = "CALENTAMIENTO"
-    temp_actual = temp_de_arranque
-    contador_pico = 0
-    iteracion = 1
-    print("----- Iniciando Proceso de Recocido Simulado  -----")
-    while True:
-        swap_elegido_info = ""
+class ArbolFenwick:
+    """
+    Árbol de Fenwick (árbol binario indexado) para sumas acumuladas.
+    Actualizar y consultar cuestan O(log n).
+    """
+    def __init__(self, n):
+        self.n = n
+        self.arbol = [0] * (n + 1)
 
-        # exploración del vecindario
-        for _ in range(iteraciones_por_nivel):
-            vecino = list(solucion_actual)
-            i, j = random.sample(range(n), 2)
+    def actualizar(self, indice, valor=1):
+        """Suma valor en la posición indice (base 0)."""
+        indice += 1
+        while indice <= self.n:
+            self.arbol[indice] += valor
+            indice += indice & -indice
 
-            valor_i = vecino[i]
-            valor_j = vecino[j]
+    def consultar(self, indice):
+        """Suma de las posiciones [0, indice)."""
+        total = 0
+        while indice > 0:
+            total += self.arbol[indice]
+            indice -= indice & -indice
+        return total
 
-            # Realizamos el swap
-            vecino[i], vecino[j] = vecino[j], vecino[i]
 
-            costo_vecino = calcularCostoDesorden(vecino)
-            diferencia_costo = costo_vecino - costo_actual
+def contarInversionesFenwick(arreglo):
+    """
+    Cuenta los pares invertidos en O(n log n) con un árbol de Fenwick.
+    Da el mismo resultado que calcularCostoDesorden.
+    """
+    rangos = {valor: r for r, valor in enumerate(sorted(set(arreglo)))}
+    arbol = ArbolFenwick(len(rangos))
+    inversiones = 0
+    for vistos, valor in enumerate(arreglo):
+        r = rangos[valor]
+        # los ya vistos que son mayores que valor forman un par invertido
+        inversiones += vistos - arbol.consultar(r + 1)
+        arbol.actualizar(r)
+    return inversiones
+
+
+class MotorInversiones:
+    """
+    Motor de costo incremental para el desorden de un arreglo.
+    Al hacer swap de las posiciones i < j solo cambian los pares que involucran
+    a i o a j, y su cambio depende únicamente de los elementos entre ellos:
+    si a = arreglo[i] < b = arreglo[j] el costo sube
+        1 + 2 * #(a < v < b) + #(v == a) + #(v == b)
+    y si a > b baja en la misma cantidad (con a y b intercambiados).
+    Para contar rápido, el arreglo se divide en bloques de posiciones y cada
+    bloque guarda sus valores ordenados; los bloques completos se cuentan con
+    bisect y solo los extremos se recorren, O(sqrt(n) log n) por swap.
+    El arreglo se modifica en sitio y el costo se mantiene en self.costo.
+    """
+    def __init__(self, arreglo, costo_inicial=None, tam_bloque=None):
+        self.arreglo = arreglo
+        n = len(arreglo)
+        if tam_bloque is None:
+            tam_bloque = max(16, int(math.sqrt(n * max(1.0, math.log2(n + 1)))))
+        self.tam_bloque = tam_bloque
+        self.bloques = [sorted(arreglo[k:k + tam_bloque]) for k in range(0, n, tam_bloque)]
+        if costo_inicial is None:
+            costo_inicial = calcularCostoDesorden(arreglo)
+        self.costo = costo_inicial
 
-            #  aceptamos el nuevo vecino
-            if diferencia_costo < 0 or random.random() < math.exp(-diferencia_costo / temp_actual):
-                solucion_actual = list(vecino)
-                costo_actual = costo_vecino
+    def _pesoEntre(self, inicio, fin, bajo, alto):
+        """
+        Suma, para las posiciones [inicio, fin), el peso de cada valor v:
+        2 si bajo < v < alto, 1 si v es igual a bajo o a alto, 0 en otro caso.
+        """
+        if inicio >= fin:
+            return 0
+        arreglo = self.arreglo
+        tam = self.tam_bloque
+        bloque_ini = inicio // tam
+        bloque_fin = (fin - 1) // tam
+        if bloque_ini == bloque_fin:
+            tramos = [(inicio, fin)]
+        else:
+            tramos = [(inicio, (bloque_ini + 1) * tam), (bloque_fin * tam, fin)]
+        peso = 0
+        for a, b in tramos:
+            for v in arreglo[a:b]:
+                if bajo < v < alto:
+                    peso += 2
+                elif v == bajo or v == alto:
+                    peso += 1
+        for k in range(bloque_ini + 1, bloque_fin):
+            bloque = self.bloques[k]
+            peso += (bisect_right(bloque, alto) + bisect_left(bloque, alto)
+                     - bisect_right(bloque, bajo) - bisect_left(bloque, bajo))
+        return peso
 
-                # aceptamos el swap
-                swap_elegido_info = f" | Swap elegido posisiones que cambian: {valor_i} <-> {valor_j}"
+    def deltaSwap(self, i, j):
+        """Cambio exacto en el número de inversiones si se intercambian i y j."""
+        if i > j:
+            i, j = j, i
+        a = self.arreglo[i]
+        b = self.arreglo[j]
+        if a == b:
+            return 0
+        if a < b:
+            return 1 + self._pesoEntre(i + 1, j, a, b)
+        return -(1 + self._pesoEntre(i + 1, j, b, a))
+
+    def aplicarSwap(self, i, j, delta=None):
+        """Intercambia i y j en sitio y actualiza el costo acumulado."""
+        if delta is None:
+            delta = self.deltaSwap(i, j)
+        arreglo = self.arreglo
+        a = arreglo[i]
+        b = arreglo[j]
+        bloque_i = self.bloques[i // self.tam_bloque]
+        bloque_j = self.bloques[j // self.tam_bloque]
+        if bloque_i is not bloque_j:
+            del bloque_i[bisect_left(bloque_i, a)]
+            insort(bloque_i, b)
+            del bloque_j[bisect_left(bloque_j, b)]
+            insort(bloque_j, a)
+        arreglo[i], arreglo[j] = b, a
+        self.costo += delta
+        return self.costo
+
+
+class ProblemaOrdenamiento(ProblemaRecocido):
+    """
+    Ordenar un arreglo con swaps aleatorios, para el motor común (motor_recocido).
+    El costo incremental lo lleva MotorInversiones sobre self.arreglo, que se modifica en sitio.
+    """
+    def __init__(self, arreglo):
+        self.arreglo = list(arreglo)
+        self.n = len(self.arreglo)
+        self.motor = MotorInversiones(self.arreglo)
+        self.mejor = list(self.arreglo)
+        self.ultimo_swap = None  # valores del último swap aceptado (para el reporte)
+        self._ultimo_delta = (None, 0)
 
-                if costo_actual < mejor_costo:
-                    mejor_solucion = list(solucion_actual)
-                    mejor_costo = costo_actual
-                    if mejor_costo == 0:
-                        break
+    def proponer(self):
+        return random.sample(range(self.n), 2)
 
-        if mejor_costo == 0: # a sido ordenado
+    def delta(self, movimiento):
+        diferencia_costo = self.motor.deltaSwap(*movimiento)
+        self._ultimo_delta = (movimiento, diferencia_costo)
+        return diferencia_costo
+
+    def aplicar(self, movimiento):
+        i, j = movimiento
+        self.ultimo_swap = (self.arreglo[i], self.arreglo[j])
+        calculado, diferencia_costo = self._ultimo_delta
+        self.motor.aplicarSwap(i, j, diferencia_costo if calculado is movimiento else None)
+
+    def deshacer(self, movimiento):
+        self.motor.aplicarSwap(*movimiento)
+
+    def guardarMejor(self):
+        self.mejor[:] = self.arreglo
+
+    def mejorSolucion(self):
+        return list(self.mejor)
+
+    def estado(self):
+        return {"arreglo": np.asarray(self.arreglo), "mejor": np.asarray(self.mejor)}
+
+    def restaurar(self, estado):
+        self.arreglo = estado["arreglo"].tolist()
+        self.mejor = estado["mejor"].tolist()
+        self.motor = MotorInversiones(self.arreglo)
+
+
+def recocidoSimulado(problema_inicial, esquema=EsquemaFijo, traza=None, verboso=True):
+    """
+    implementa el recocido simulado:
+    1. calentamiento gradual.
+    2. mantenimiento en temperatura máxima.
+    3. enfriamiento gradual.
+    esquema es la clase (o fábrica) del esquema de temperatura, p. ej. EsquemaAdaptativo.
+    traza es un RegistroTraza opcional que guarda la convergencia por nivel;
+    con verboso=False no se imprime nada por nivel.
+    El ciclo es el de motor_recocido.recocer; termina antes si el arreglo queda ordenado.
+    """
+    n = len(problema_inicial)
+    # el motor lleva el costo incremental y modifica el arreglo en sitio
+    problema = ProblemaOrdenamiento(problema_inicial)
+    costo_actual = problema.motor.costo
+
+    if verboso:
+        print(f"Solución Inicial (Arreglo Desordenado): {problema.arreglo}")
+        print(f"Costo Inicial (Desorden): {costo_actual:.2f}\n")
+
+    # parámetros de la simulación
+    iteraciones_por_nivel = n * 10
+    control = esquema(
+        temp_de_arranque=float(n) / 4,
+        temp_maxima=float(n * 10),
+        temp_minima=1e-5,
+        factor_calentamiento=1.02,
+        iteraciones_en_pico=n * 10,  # cuando ya está caliente
+        factor_enfriamiento=1.0 - (1.0 / (n * 10.0)),
+    )
+
+    def reporte(iteracion, control, costo_anterior, costo_actual, mejor_costo):
+        swap_elegido_info = ""
+        if problema.ultimo_swap is not None:
+            swap_elegido_info = f" | Swap elegido posisiones que cambian: {problema.ultimo_swap[0]} <-> {problema.ultimo_swap[1]}"
+        if control.motivo_paro == "optimo":  # a sido ordenado
             print(f"Iteración {iteracion:3}: Solución óptima (costo 0) encontrada{swap_elegido_info}")
-            print(f"           Arreglo final:   {solucion_actual}\n")
-            break
-
-        if estado_actual == "CALENTAMIENTO":
-            temp_actual *= factor_calentamiento
-            if temp_actual >= temp_maxima:
-                temp_actual = temp_maxima
-                estado_actual = "PICO_TEMPERATURA"
-
-        elif estado_actual == "PICO_TEMPERATURA":
-            contador_pico += 1
-            if contador_pico >= iteraciones_en_pico:
-                estado_actual = "ENFRIAMIENTO"
-
-        elif estado_actual == "ENFRIAMIENTO":
-            temp_actual *= factor_enfriamiento
-            if temp_actual < temp_minima:
-                break
-        # impresion
+            print(f"           Arreglo final:   {problema.arreglo}\n")
+            return
         print(
-            f"Iteración {iteracion:3}: Fase={estado_actual:<18} Temp={temp_actual:9.3f}, Costo actual={costo_actual:8.2f}, Mejor Costo={mejor_costo:8.2f}{swap_elegido_info}")
-        print(f"           Arreglo actual:  {solucion_actual}\n")
-        iteracion += 1
+            f"Iteración {iteracion:3}: Fase={control.fase:<18} Temp={control.temperatura:9.3f}, Costo actual={costo_actual:8.2f}, Mejor Costo={mejor_costo:8.2f}{swap_elegido_info}")
+        print(f"           Arreglo actual:  {problema.arreglo}\n")
+        problema.ultimo_swap = None
 
-    return mejor_solucion, mejor_costo
+    if verboso:
+        print("----- Iniciando Proceso de Recocido Simulado  -----")
+    _, mejor_costo = recocer(problema, control, costo_actual, iteraciones_por_nivel, traza=traza,
+                             verboso=verboso, reporte=reporte, costo_objetivo=0)
+    return problema.mejorSolucion(), mejor_costo
 
 
 # problema de ordenamiento
@@ -121,4 +294,5 @@ if __name__ == "__main__":
     recorrido_optimo, costo_optimo = recocidoSimulado(arreglo_desordenado)
 
     print("\n--- Resultados Finales ---")
-    print(f" Arreglo ordenado: {recorrido_optimo}")
\ No newline at end of file
+    print(f" Arreglo ordenado: {recorrido_optimo}")
+    print(f" Costo verificado: {calcularCostoDesorden(recorrido_optimo)}")
\ No newline at end of file
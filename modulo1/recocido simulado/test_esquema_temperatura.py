@@ -0,0 +1,38 @@
+"""
+Pruebas de la máquina de fases de los esquemas de temperatura con un mejor costo plano
+(nunca mejora), así las transiciones dependen solo de las ventanas y los contadores.
+"""
+from esquema_temperatura import EsquemaAdaptativo, EsquemaFijo
+
+
+def recorrerFases(esquema, max_niveles=100000):
+    """Llama registrarNivel sin aceptar nada y con costo fijo; regresa la fase de cada nivel."""
+    fases = []
+    while len(fases) < max_niveles:
+        fases.append(esquema.fase)
+        if esquema.registrarNivel(0, 1, 5.0):
+            break
+    return fases
+
+
+def test_pico_adaptativo_dura_la_ventana_completa():
+    esquema = EsquemaAdaptativo(1, 1000, 1e-3, 1.05, 100, 0.95)
+    fases = recorrerFases(esquema)
+    # el calentamiento ya pasó más de ventana_pico niveles sin mejorar
+    assert fases.count("CALENTAMIENTO") > esquema.ventana_pico
+    assert fases.count("PICO_TEMPERATURA") == esquema.ventana_pico
+    assert fases[-1] == "ENFRIAMIENTO"
+
+
+def test_pico_adaptativo_limitado_por_iteraciones_en_pico():
+    esquema = EsquemaAdaptativo(1, 1000, 1e-3, 1.05, 5, 0.95)
+    fases = recorrerFases(esquema)
+    assert fases.count("PICO_TEMPERATURA") == 5
+
+
+def test_pico_fijo():
+    esquema = EsquemaFijo(1, 1000, 1e-3, 1.05, 100, 0.95)
+    fases = recorrerFases(esquema)
+    assert fases.count("PICO_TEMPERATURA") == 100
+    assert esquema.motivo_paro == "temperatura_minima"
+    assert len(fases) == esquema.nivelesEsquemaFijo()
@@ -0,0 +1,73 @@
+"""
+Registro de la convergencia del recocido simulado sin imprimir en cada nivel.
+Guarda en un buffer circular de tamaño fijo una muestra de los niveles:
+(nivel, fase, temperatura, costo actual, mejor costo, tasa de aceptación)
+y al final se puede exportar a CSV o a .npy.
+Así los recocidos pueden correr con verboso=False sin perder los datos de convergencia.
+"""
+import csv
+import numpy as np
+
+FASES = ("CALENTAMIENTO", "PICO_TEMPERATURA", "ENFRIAMIENTO")
+
+TIPO_REGISTRO = np.dtype([
+    ("nivel", np.int64),
+    ("fase", np.int8),  # índice en FASES
+    ("temperatura", np.float64),
+    ("costo_actual", np.float64),
+    ("mejor_costo", np.float64),
+    ("tasa_aceptacion", np.float64),
+])
+
+
+class RegistroTraza:
+    """
+    Buffer circular de registros por nivel.
+    capacidad: número máximo de registros guardados (al llenarse se pisan los más viejos).
+    cada: solo se guarda un nivel de cada 'cada' niveles (muestreo).
+    """
+    def __init__(self, capacidad=10000, cada=1):
+        if capacidad <= 0 or cada <= 0:
+            raise ValueError("capacidad y cada deben ser positivos")
+        self.capacidad = capacidad
+        self.cada = cada
+        self.registros = np.zeros(capacidad, dtype=TIPO_REGISTRO)
+        self.total = 0  # registros guardados desde el inicio (incluye los ya pisados)
+
+    def registrar(self, nivel, fase, temperatura, costo_actual, mejor_costo, tasa_aceptacion):
+        """Guarda el nivel si le toca según el muestreo. Costo O(1), sin reservar memoria."""
+        if nivel % self.cada:
+            return
+        self.registros[self.total % self.capacidad] = (
+            nivel, FASES.index(fase), temperatura, costo_actual, mejor_costo, tasa_aceptacion)
+        self.total += 1
+
+    def datos(self):
+        """Registros guardados, del más viejo al más nuevo."""
+        if self.total <= self.capacidad:
+            return self.registros[:self.total].copy()
+        inicio = self.total % self.capacidad
+        return np.concatenate((self.registros[inicio:], self.registros[:inicio]))
+
+    def exportarNpy(self, ruta):
+        """Guarda los registros como arreglo estructurado de NumPy."""
+        np.save(ruta, self.datos())
+
+    def exportarCsv(self, ruta):
+        """Guarda los registros en CSV con la fase por nombre."""
+        with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(TIPO_REGISTRO.names)
+            for registro in self.datos():
+                escritor.writerow([int(registro["nivel"]), FASES[registro["fase"]],
+                                   float(registro["temperatura"]), float(registro["costo_actual"]),
+                                   float(registro["mejor_costo"]), float(registro["tasa_aceptacion"])])
+
+    def exportar(self, ruta):
+        """Exporta según la extensión: .npy o .csv."""
+        if str(ruta).endswith(".npy"):
+            self.exportarNpy(ruta)
+        elif str(ruta).endswith(".csv"):
+            self.exportarCsv(ruta)
+        else:
+            raise ValueError(f"Extensión no soportada para la traza: {ruta}")
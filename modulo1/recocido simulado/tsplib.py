@@ -0,0 +1,135 @@
+"""
+Lectura de instancias TSPLIB (.tsp) desde archivos locales.
+Soporta coordenadas con EDGE_WEIGHT_TYPE EUC_2D, CEIL_2D, ATT y GEO, y matrices
+explícitas (EXPLICIT) en los formatos FULL_MATRIX, UPPER_ROW, LOWER_ROW,
+UPPER_DIAG_ROW y LOWER_DIAG_ROW. Las distancias se redondean como indica TSPLIB,
+así los costos son comparables con los óptimos publicados.
+Todas las matrices se arman por bloques de filas (ELEMENTOS_POR_BLOQUE valores
+temporales), sin arreglos temporales NxN completos.
+"""
+import numpy as np
+from matriz_distancias import ELEMENTOS_POR_BLOQUE, construirMatrizDistancias
+
+TIPOS_SOPORTADOS = ("EUC_2D", "CEIL_2D", "ATT", "GEO", "EXPLICIT")
+
+
+def leerTsplib(ruta):
+    """
+    Lee un archivo .tsp. Regresa un dict con nombre, dimension, tipo_peso,
+    coordenadas (arreglo (n, 2) o None) y pesos (lista de números de
+    EDGE_WEIGHT_SECTION o None), más el resto de los campos del encabezado.
+    """
+    instancia = {"coordenadas": None, "pesos": None}
+    seccion = None
+    coordenadas = []
+    pesos = []
+    with open(ruta, encoding="utf-8") as archivo:
+        for linea in archivo:
+            linea = linea.strip()
+            if linea == "EOF":
+                break
+            if not linea:
+                continue
+            clave = linea.split(":", 1)[0].strip()
+            if clave.endswith("_SECTION"):
+                seccion = clave
+                continue
+            if ":" in linea and clave[:1].isalpha():
+                instancia[clave.lower()] = linea.split(":", 1)[1].strip()
+                seccion = None
+                continue
+            if seccion == "NODE_COORD_SECTION":
+                _, x, y = linea.split()[:3]
+                coordenadas.append((float(x), float(y)))
+            elif seccion == "EDGE_WEIGHT_SECTION":
+                pesos.extend(float(valor) for valor in linea.split())
+            # otras secciones (DISPLAY_DATA_SECTION, ...) no se usan
+
+    instancia["dimension"] = int(instancia["dimension"])
+    instancia["tipo_peso"] = instancia.pop("edge_weight_type", "EUC_2D").upper()
+    instancia["nombre"] = instancia.pop("name", str(ruta))
+    if instancia["tipo_peso"] not in TIPOS_SOPORTADOS:
+        raise ValueError(f"EDGE_WEIGHT_TYPE no soportado: {instancia['tipo_peso']}")
+    if coordenadas:
+        instancia["coordenadas"] = np.array(coordenadas)
+    if pesos:
+        instancia["pesos"] = pesos
+    return instancia
+
+
+def _radianesGeo(valor):
+    """Convierte GRADOS.MINUTOS de TSPLIB a radianes (con la misma PI de la referencia)."""
+    grados = np.trunc(valor)
+    minutos = valor - grados
+    return 3.141592 * (grados + 5.0 * minutos / 3.0) / 180.0
+
+
+def _matrizPorBloques(n, filas):
+    """Matriz n x n llenada por bloques de filas: filas(inicio, fin) calcula esas filas."""
+    matriz = np.empty((n, n))
+    filas_por_bloque = max(1, ELEMENTOS_POR_BLOQUE // max(n, 1))
+    for inicio in range(0, n, filas_por_bloque):
+        fin = min(inicio + filas_por_bloque, n)
+        matriz[inicio:fin] = filas(inicio, fin)
+    return matriz
+
+
+def matrizTsplib(instancia):
+    """Matriz de distancias enteras de la instancia según su EDGE_WEIGHT_TYPE."""
+    n = instancia["dimension"]
+    tipo = instancia["tipo_peso"]
+    if tipo == "EXPLICIT":
+        return _matrizExplicita(instancia["pesos"], n, instancia.get("edge_weight_format", "FULL_MATRIX").upper())
+
+    coordenadas = instancia["coordenadas"]
+    if tipo in ("EUC_2D", "CEIL_2D"):
+        matriz = construirMatrizDistancias(coordenadas)
+        if tipo == "EUC_2D":
+            matriz += 0.5
+            return np.floor(matriz, out=matriz)
+        return np.ceil(matriz, out=matriz)
+    if tipo == "ATT":
+        def filasAtt(inicio, fin):
+            cuadrados = np.zeros((fin - inicio, n))
+            for eje in range(2):
+                diferencia = coordenadas[inicio:fin, eje][:, None] - coordenadas[:, eje][None, :]
+                cuadrados += diferencia * diferencia
+            r = np.sqrt(cuadrados / 10.0)
+            t = np.floor(r + 0.5)
+            return np.where(t < r, t + 1, t)
+        return _matrizPorBloques(n, filasAtt)
+
+    # GEO: distancia sobre la esfera terrestre
+    latitud = _radianesGeo(coordenadas[:, 0])
+    longitud = _radianesGeo(coordenadas[:, 1])
+
+    def filasGeo(inicio, fin):
+        q1 = np.cos(longitud[inicio:fin, None] - longitud[None, :])
+        q2 = np.cos(latitud[inicio:fin, None] - latitud[None, :])
+        q3 = np.cos(latitud[inicio:fin, None] + latitud[None, :])
+        argumento = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+        return np.trunc(6378.388 * np.arccos(argumento) + 1.0)
+    matriz = _matrizPorBloques(n, filasGeo)
+    np.fill_diagonal(matriz, 0.0)
+    return matriz
+
+
+def _matrizExplicita(pesos, n, formato):
+    """Arma la matriz completa a partir de EDGE_WEIGHT_SECTION."""
+    pesos = np.asarray(pesos)
+    if formato == "FULL_MATRIX":
+        return pesos[:n * n].reshape(n, n)
+    matriz = np.zeros((n, n))
+    if formato == "UPPER_ROW":
+        filas, columnas = np.triu_indices(n, 1)
+    elif formato == "UPPER_DIAG_ROW":
+        filas, columnas = np.triu_indices(n)
+    elif formato == "LOWER_ROW":
+        filas, columnas = np.tril_indices(n, -1)
+    elif formato == "LOWER_DIAG_ROW":
+        filas, columnas = np.tril_indices(n)
+    else:
+        raise ValueError(f"EDGE_WEIGHT_FORMAT no soportado: {formato}")
+    matriz[filas, columnas] = pesos[:len(filas)]
+    matriz[columnas, filas] = pesos[:len(filas)]
+    return matriz
@@ -1,6 +1,9 @@
-import math
 import random
 import numpy as np
+from esquema_temperatura import EsquemaFijo
+from matriz_distancias import construirMatrizDistancias
+from motor_recocido import ProblemaRecocido, recocer
+from recorrido import Recorrido
 
 
 def calcularDistanciaTotal(recorrido, matriz_dist):
@@ -11,6 +14,31 @@ def calcularDistanciaTotal(recorrido, matriz_dist):
     return distancia
 
 
+def deltaSwap(recorrido, i, j, matriz_dist):
+    """
+    Cambio en la distancia total si se intercambian las posiciones i y j.
+    Solo cambian las aristas que tocan a i y a j (cuatro, o tres si son vecinas),
+    así que el costo es O(1) y no se copia el recorrido.
+    """
+    if i > j:
+        i, j = j, i
+    a = recorrido[i]
+    b = recorrido[j]
+    anterior_a = recorrido[i - 1]
+    siguiente_b = recorrido[j + 1]
+    if j == i + 1:
+        antes = matriz_dist[anterior_a][a] + matriz_dist[a][b] + matriz_dist[b][siguiente_b]
+        despues = matriz_dist[anterior_a][b] + matriz_dist[b][a] + matriz_dist[a][siguiente_b]
+        return despues - antes
+    siguiente_a = recorrido[i + 1]
+    anterior_b = recorrido[j - 1]
+    antes = (matriz_dist[anterior_a][a] + matriz_dist[a][siguiente_a]
+             + matriz_dist[anterior_b][b] + matriz_dist[b][siguiente_b])
+    despues = (matriz_dist[anterior_a][b] + matriz_dist[b][siguiente_a]
+               + matriz_dist[anterior_b][a] + matriz_dist[a][siguiente_b])
+    return despues - antes
+
+
 def vecinoMasCercano(matriz_dist):
     """
     Heurística del vecino más cercano.
@@ -30,89 +58,77 @@ def vecinoMasCercano(matriz_dist):
     return recorrido
 
 
+class ProblemaSwaps(ProblemaRecocido):
+    """TSP solo con swaps para el motor común; guarda el último swap aceptado para el reporte."""
+    def __init__(self, recorrido, matriz_dist):
+        self.recorrido = recorrido
+        self.mejor = recorrido.copia()
+        self.matriz_dist = matriz_dist
+        self.n = len(recorrido) - 1
+        self.swap_escogido = "Ninguno"
+
+    def proponer(self):
+        return random.sample(range(1, self.n), 2)
+
+    def delta(self, movimiento):
+        # Solo se evalúan las aristas afectadas, sin copiar el recorrido
+        return deltaSwap(self.recorrido.ciudades, movimiento[0], movimiento[1], self.matriz_dist)
+
+    def aplicar(self, movimiento):
+        i, j = movimiento
+        # Guardamos las ciudades que se van a intercambiar para poder imprimirlas
+        self.swap_escogido = f"({self.recorrido.ciudades[i]} <-> {self.recorrido.ciudades[j]})"
+        self.recorrido.intercambiar(i, j)
+
+    def deshacer(self, movimiento):
+        self.recorrido.intercambiar(*movimiento)
+
+    def guardarMejor(self):
+        self.mejor.copiarDe(self.recorrido)
+
+    def mejorSolucion(self):
+        return self.mejor.tolist()
+
+
 def recocidoSimulado(matriz_dist):
     """
     Implementa el recocido simulado:
     1. Calentamiento gradual.
     2. Mantenimiento en temperatura máxima.
     3. Enfriamiento gradual.
+    El ciclo de fases es el del motor común (motor_recocido.recocer con EsquemaFijo).
     """
     n = len(matriz_dist)
+    matriz_dist = np.asarray(matriz_dist)
     # Solución Inicial
     solucion_actual = vecinoMasCercano(matriz_dist)
     costo_actual = calcularDistanciaTotal(solucion_actual, matriz_dist)
-    mejor_solucion = list(solucion_actual)
-    mejor_costo = costo_actual
 
     print(f"Solución Inicial (Vecino Más Cercano): {solucion_actual}")
     print(f"Costo Inicial: {costo_actual:.2f}\n")
+    # recorrido actual y mejor en arreglos que se modifican en sitio
+    problema = ProblemaSwaps(Recorrido(solucion_actual), matriz_dist)
 
     # Parámetros de la simulación
-    temp_de_arranque = float(n)  # empieza bajo
-    temp_maxima = float(n * 20)  # pico de temperatura
-    temp_minima = 1e-5  # criterio de paro
-    iteraciones_por_nivel = n * 2 # tamano del vecindario
-    factor_calentamiento = 1.01  # sube la temp
-    iteraciones_en_pico = n * 20  # iteraciones en temp máxima
-    factor_enfriamiento = 1.0 - (1.0 / (n * 10.0))  # enfría lentamente con base en temp
-
-    # Control de fases
-    estado_actual = "CALENTAMIENTO"  # Estados: CALENTAMIENTO, PICO_TEMPERATURA, ENFRIAMIENTO
-    temp_actual = temp_de_arranque
-    contador_pico = 0
-    iteracion = 1
-    print("----- Iniciando Proceso de Recocido Simulado -----")
-    while True:
-        # MODIFICACIoN: Variable para guardar el último swap
-        swap_escogido = "Ninguno"
-
-        # Exploración del vecindario
-        for _ in range(iteraciones_por_nivel):
-            vecino = list(solucion_actual)
-            i, j = random.sample(range(1, n), 2)
-
-            # Guardamos las ciudades que se van a intercambiar para poder imprimirlas
-            ciudades_intercambiadas = (vecino[i], vecino[j])
-
-            vecino[i], vecino[j] = vecino[j], vecino[i]
-            costo_vecino = calcularDistanciaTotal(vecino, matriz_dist)
-            diferencia_costo = costo_vecino - costo_actual
-
-            # Criterio de aceptación de Metropolis
-            if diferencia_costo < 0 or random.random() < math.exp(-diferencia_costo / temp_actual):
-                solucion_actual = list(vecino)
-                costo_actual = costo_vecino
-
-                #Guardamos la información del swap que fue aceptado
-                swap_escogido = f"({ciudades_intercambiadas[0]} <-> {ciudades_intercambiadas[1]})"
-
-                if costo_actual < mejor_costo:
-                    mejor_solucion = list(solucion_actual)
-                    mejor_costo = costo_actual
-
-        # Lógica de transición de fases y temperatura
-        if estado_actual == "CALENTAMIENTO":
-            temp_actual *= factor_calentamiento
-            if temp_actual >= temp_maxima:
-                temp_actual = temp_maxima
-                estado_actual = "PICO_TEMPERATURA"
-
-        elif estado_actual == "PICO_TEMPERATURA":
-            contador_pico += 1
-            if contador_pico >= iteraciones_en_pico:
-                estado_actual = "ENFRIAMIENTO"
-
-        elif estado_actual == "ENFRIAMIENTO":
-            temp_actual *= factor_enfriamiento
-            if temp_actual < temp_minima:
-                break  # termina el algoritmo
-
+    iteraciones_por_nivel = n * 2  # tamano del vecindario
+    control = EsquemaFijo(
+        temp_de_arranque=float(n),  # empieza bajo
+        temp_maxima=float(n * 20),  # pico de temperatura
+        temp_minima=1e-5,  # criterio de paro
+        factor_calentamiento=1.01,  # sube la temp
+        iteraciones_en_pico=n * 20,  # iteraciones en temp máxima
+        factor_enfriamiento=1.0 - (1.0 / (n * 10.0)),  # enfría lentamente con base en temp
+    )
+
+    def reporte(iteracion, control, costo_anterior, costo_actual, mejor_costo):
         # >>> MODIFICACIÓN: Se añade el swap escogido al print de cada iteración
         print(
-            f"Iteración {iteracion:3}: Fase={estado_actual:<18} Temp={temp_actual:9.3f}, Costo Actual={costo_actual:8.2f}, Mejor Costo={mejor_costo:8.2f}, Swap Escogido={swap_escogido}")
-        iteracion += 1
+            f"Iteración {iteracion:3}: Fase={control.fase:<18} Temp={control.temperatura:9.3f}, Costo Actual={costo_actual:8.2f}, Mejor Costo={mejor_costo:8.2f}, Swap Escogido={problema.swap_escogido}")
+        problema.swap_escogido = "Ninguno"
 
-    return mejor_solucion, mejor_costo
+    print("----- Iniciando Proceso de Recocido Simulado -----")
+    _, mejor_costo = recocer(problema, control, costo_actual, iteraciones_por_nivel, reporte=reporte)
+    return problema.mejorSolucion(), mejor_costo
 
 
 if __name__ == "__main__":
@@ -138,16 +154,7 @@ if __name__ == "__main__":
 
     # Generación aleatoria del problema
     #coordenadas = np.random.rand(NUM_CIUDADES, 2) * 100
-    #distancias = np.zeros((NUM_CIUDADES, NUM_CIUDADES))
-    distancias = np.array([
-        [0, 6, 10, 8],
-        [6, 0, 8, 10],
-        [10, 8, 0, 6],
-        [8, 10, 6, 0],
-    ])
-    for i in range(NUM_CIUDADES):
-        for j in range(NUM_CIUDADES):
-            distancias[i][j] = np.linalg.norm(coordenadas[i] - coordenadas[j])
+    distancias = construirMatrizDistancias(coordenadas[:NUM_CIUDADES])
 
 
 
@@ -1,6 +1,20 @@
 import math
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import numpy as np
+from esquema_temperatura import EsquemaFijo
+from matriz_distancias import abrirMatrizDistancias, construirMatrizDistancias, copiarPorBloques, esSimetrica
+from motor_recocido import ProblemaRecocido, explorarNivel, recocer
+from puntos_control import huellaArreglo
+from recorrido import Recorrido
+
+# mezcla de operadores de vecindario: probabilidad de proponer cada movimiento
+OPERADORES_POR_DEFECTO = {"swap": 0.2, "2opt": 0.5, "oropt": 0.3}
+K_VECINOS = 10  # tamaño de las listas de candidatos
+LARGO_MAXIMO_OROPT = 3  # Or-opt reubica segmentos de 1 a 3 ciudades
+MOV_SWAP, MOV_2OPT, MOV_OROPT = 0, 1, 2  # tipos de movimiento de ProblemaTSP
 
 
 def calcularDistanciaTotal(recorrido, matriz_dist):
@@ -11,6 +25,98 @@ def calcularDistanciaTotal(recorrido, matriz_dist):
     return distancia
 
 
+def deltaSwap(recorrido, i, j, matriz_dist):
+    """
+    Cambio en la distancia total si se intercambian las posiciones i y j.
+    Solo cambian las aristas que tocan a i y a j (cuatro, o tres si son vecinas),
+    así que el costo es O(1) y no se copia el recorrido.
+    matriz_dist es un arreglo de NumPy (se indexa matriz_dist[a, b], sin crear la fila).
+    """
+    if i > j:
+        i, j = j, i
+    a = recorrido[i]
+    b = recorrido[j]
+    anterior_a = recorrido[i - 1]
+    siguiente_b = recorrido[j + 1]
+    if j == i + 1:
+        antes = matriz_dist[anterior_a, a] + matriz_dist[a, b] + matriz_dist[b, siguiente_b]
+        despues = matriz_dist[anterior_a, b] + matriz_dist[b, a] + matriz_dist[a, siguiente_b]
+        return despues - antes
+    siguiente_a = recorrido[i + 1]
+    anterior_b = recorrido[j - 1]
+    antes = (matriz_dist[anterior_a, a] + matriz_dist[a, siguiente_a]
+             + matriz_dist[anterior_b, b] + matriz_dist[b, siguiente_b])
+    despues = (matriz_dist[anterior_a, b] + matriz_dist[b, siguiente_a]
+               + matriz_dist[anterior_b, a] + matriz_dist[a, siguiente_b])
+    return despues - antes
+
+
+def construirListasCandidatos(matriz_dist, k=K_VECINOS):
+    """
+    Para cada ciudad, sus k vecinos más cercanos ordenados por distancia.
+    Se calcula fila por fila con argpartition para no duplicar la matriz.
+    """
+    n = len(matriz_dist)
+    k = min(k, n - 1)
+    candidatos = []
+    for ciudad in range(n):
+        fila = np.asarray(matriz_dist[ciudad], dtype=float)
+        cercanos = np.argpartition(fila, k)[:k + 1]
+        cercanos = cercanos[cercanos != ciudad][:k]
+        cercanos = cercanos[np.argsort(fila[cercanos], kind="stable")]
+        candidatos.append(cercanos.tolist())
+    return candidatos
+
+
+def delta2Opt(recorrido, p, q, matriz_dist):
+    """
+    Cambio en la distancia al invertir el segmento de las posiciones p+1 a q.
+    Se quitan las aristas (p, p+1) y (q, q+1) y se ponen (p, q) y (p+1, q+1).
+    Supone una matriz simétrica: el segmento invertido mide lo mismo.
+    """
+    a = recorrido[p]
+    b = recorrido[p + 1]
+    c = recorrido[q]
+    d = recorrido[q + 1]
+    return matriz_dist[a, c] + matriz_dist[b, d] - matriz_dist[a, b] - matriz_dist[c, d]
+
+
+def deltaOrOpt(recorrido, inicio, fin, destino, matriz_dist):
+    """
+    Cambio en la distancia al mover el segmento de las posiciones inicio a fin
+    para que quede justo después de la posición destino (fuera del segmento).
+    El segmento conserva su sentido, así que también es exacto para matrices asimétricas.
+    """
+    anterior = recorrido[inicio - 1]
+    primero = recorrido[inicio]
+    ultimo = recorrido[fin]
+    siguiente = recorrido[fin + 1]
+    c = recorrido[destino]
+    c_siguiente = recorrido[destino + 1]
+    antes = matriz_dist[anterior, primero] + matriz_dist[ultimo, siguiente] + matriz_dist[c, c_siguiente]
+    despues = matriz_dist[anterior, siguiente] + matriz_dist[c, primero] + matriz_dist[ultimo, c_siguiente]
+    return despues - antes
+
+
+def deltasLoteSwaps(recorrido, matriz_dist, i, j):
+    """
+    Versión vectorizada de deltaSwap: recibe arreglos de posiciones i < j y
+    calcula el delta de todos los swaps a la vez con indexado avanzado en la matriz.
+    """
+    a = recorrido[i]
+    b = recorrido[j]
+    anterior_a = recorrido[i - 1]
+    siguiente_a = recorrido[i + 1]
+    anterior_b = recorrido[j - 1]
+    siguiente_b = recorrido[j + 1]
+    vecinas = j == i + 1
+    antes = (matriz_dist[anterior_a, a] + matriz_dist[b, siguiente_b]
+             + np.where(vecinas, matriz_dist[a, b], matriz_dist[a, siguiente_a] + matriz_dist[anterior_b, b]))
+    despues = (matriz_dist[anterior_a, b] + matriz_dist[a, siguiente_b]
+               + np.where(vecinas, matriz_dist[b, a], matriz_dist[b, siguiente_a] + matriz_dist[anterior_b, a]))
+    return despues - antes
+
+
 def vecinoMasCercano(matriz_dist):
     """
     heurística del vecino más cercano.
@@ -30,84 +136,420 @@ def vecinoMasCercano(matriz_dist):
     return recorrido
 
 
-def recocidoSimulado(matriz_dist):
+def probabilidadesOperadores(operadores, matriz_dist):
+    """
+    Valida la mezcla de operadores y la convierte en probabilidades acumuladas
+    (prob_swap, prob_2opt); lo que resta hasta 1 es Or-opt.
+    """
+    desconocidos = set(operadores) - set(OPERADORES_POR_DEFECTO)
+    if desconocidos:
+        raise ValueError(f"Operadores desconocidos: {sorted(desconocidos)}")
+    peso_total = float(sum(operadores.values()))
+    if peso_total <= 0:
+        raise ValueError("La mezcla de operadores debe tener algún peso positivo")
+    prob_swap = operadores.get("swap", 0.0) / peso_total
+    prob_2opt = prob_swap + operadores.get("2opt", 0.0) / peso_total
+    if operadores.get("2opt", 0.0) > 0 and not esSimetrica(matriz_dist):
+        raise ValueError("2-opt requiere una matriz de distancias simétrica")
+    return prob_swap, prob_2opt
+
+
+def parametrosRecocido(n):
+    """Parámetros del esquema de temperatura para n ciudades (el esquema recibe todos menos iteraciones_por_nivel)."""
+    return {
+        "temp_de_arranque": float(n),  # empieza bajo
+        "temp_maxima": float(n * 30),  # pico de temperatura
+        "temp_minima": 1e-5,  # criterio de paro
+        "iteraciones_por_nivel": n * 10,  # tamano del vecindario
+        "factor_calentamiento": 1.02,  # sube un en cada paso
+        "iteraciones_en_pico": n * 40,  # iteraciones  en temp máxima
+        "factor_enfriamiento": 1.0 - (1.0 / (n * 10.0)),  # enfria lentamente
+    }
+
+
+class ProblemaTSP(ProblemaRecocido):
+    """
+    TSP para el motor común (motor_recocido): mezcla de swap, 2-opt y Or-opt sobre
+    un Recorrido que se modifica en sitio. Los movimientos son tuplas (tipo, x, y, z);
+    2-opt y Or-opt se guían con las listas de candidatos.
+    """
+    def __init__(self, recorrido, matriz_dist, candidatos, prob_swap, prob_2opt):
+        self.recorrido = recorrido
+        self.mejor = recorrido.copia()
+        self.matriz_dist = matriz_dist
+        self.candidatos = candidatos
+        self.prob_swap = prob_swap
+        self.prob_2opt = prob_2opt
+        self.n = len(recorrido) - 1
+
+    def proponer(self):
+        n = self.n
+        operador = random.random()
+        if operador < self.prob_swap:
+            i, j = random.sample(range(1, n), 2)
+            return (MOV_SWAP, i, j, 0)
+        posicion = self.recorrido.posicion
+        candidatos = self.candidatos
+        if operador < self.prob_2opt:
+            # unir una ciudad con uno de sus vecinos cercanos invirtiendo el tramo entre ellos
+            ciudad = self.recorrido.ciudades[random.randrange(n)]
+            p, q = sorted((posicion[ciudad], posicion[random.choice(candidatos[ciudad])]))
+            if q - p < 2:
+                return None
+            return (MOV_2OPT, p, q, 0)
+        # llevar un segmento corto justo después de un vecino cercano de su primera ciudad
+        inicio = random.randrange(1, n)
+        fin = min(inicio + random.randrange(LARGO_MAXIMO_OROPT), n - 1)
+        destino = posicion[random.choice(candidatos[self.recorrido.ciudades[inicio]])]
+        if inicio - 1 <= destino <= fin:
+            return None
+        return (MOV_OROPT, inicio, fin, destino)
+
+    def delta(self, movimiento):
+        tipo, x, y, z = movimiento
+        if tipo == MOV_SWAP:
+            return deltaSwap(self.recorrido.ciudades, x, y, self.matriz_dist)
+        if tipo == MOV_2OPT:
+            return delta2Opt(self.recorrido.ciudades, x, y, self.matriz_dist)
+        return deltaOrOpt(self.recorrido.ciudades, x, y, z, self.matriz_dist)
+
+    def aplicar(self, movimiento):
+        tipo, x, y, z = movimiento
+        if tipo == MOV_SWAP:
+            self.recorrido.intercambiar(x, y)
+        elif tipo == MOV_2OPT:
+            self.recorrido.invertir(x + 1, y)
+        else:
+            self.recorrido.moverSegmento(x, y, z)
+
+    def deshacer(self, movimiento):
+        tipo, x, y, z = movimiento
+        if tipo != MOV_OROPT:
+            # swap e inversión son su propio inverso
+            self.aplicar(movimiento)
+        elif z > y:
+            largo = y - x + 1
+            self.recorrido.moverSegmento(z - largo + 1, z, x - 1)
+        else:
+            largo = y - x + 1
+            self.recorrido.moverSegmento(z + 1, z + largo, y)
+
+    def guardarMejor(self):
+        self.mejor.copiarDe(self.recorrido)
+
+    def mejorSolucion(self):
+        return self.mejor.tolist()
+
+    def estado(self):
+        return {"solucion_actual": self.recorrido.ciudades, "mejor_solucion": self.mejor.ciudades}
+
+    def restaurar(self, estado):
+        self.recorrido = Recorrido(estado["solucion_actual"])
+        self.mejor = Recorrido(estado["mejor_solucion"])
+
+
+class ProblemaTSPLotes(ProblemaTSP):
+    """
+    Modo por lotes: solo swaps, evaluados de tam_lote en tam_lote con NumPy.
+    Reemplaza la exploración del motor con explorarNivel.
+    """
+    def __init__(self, recorrido, matriz_dist, tam_lote):
+        super().__init__(recorrido, matriz_dist, None, 1.0, 1.0)
+        self.tam_lote = tam_lote
+
+    def explorarNivel(self, costo_actual, mejor_costo, temp_actual, iteraciones):
+        """
+        Explora un nivel de temperatura con swaps evaluados en lotes de tam_lote.
+        Los deltas y los umbrales de Metropolis (-T ln u) se calculan con NumPy para
+        todo el lote; después se recorre el lote en orden aceptando si delta < umbral,
+        que es el mismo criterio que random() < exp(-delta / T).
+        Un swap aceptado deja obsoletos los deltas de los swaps que leen sus posiciones
+        o las vecinas; esos se recalculan con deltaSwap antes de decidir, así el
+        resultado es el de aplicar los movimientos uno por uno.
+        Regresa (costo_actual, mejor_costo, aceptados).
+        """
+        recorrido = self.recorrido
+        ciudades = recorrido.ciudades
+        matriz_dist = self.matriz_dist
+        n = self.n
+        aceptados = 0
+        restantes = iteraciones
+        while restantes > 0:
+            k = min(self.tam_lote, restantes)
+            restantes -= k
+            pares = np.sort(np.random.randint(1, n, size=(k, 2)), axis=1)
+            i = pares[:, 0]
+            j = pares[:, 1]
+            deltas = deltasLoteSwaps(ciudades, matriz_dist, i, j)
+            umbrales = -temp_actual * np.log(1.0 - np.random.random(k))
+            sucias = set()  # posiciones cuyo vecindario cambió por un swap aceptado en este lote
+            for i_m, j_m, delta, umbral in zip(i.tolist(), j.tolist(), deltas.tolist(), umbrales.tolist()):
+                if i_m == j_m:
+                    continue
+                if sucias and (i_m in sucias or j_m in sucias):
+                    delta = float(deltaSwap(ciudades, i_m, j_m, matriz_dist))
+                if delta < umbral:
+                    recorrido.intercambiar(i_m, j_m)
+                    costo_actual += delta
+                    aceptados += 1
+                    sucias.update((i_m - 1, i_m, i_m + 1, j_m - 1, j_m, j_m + 1))
+                    if costo_actual < mejor_costo:
+                        mejor_costo = costo_actual
+                        self.mejor.copiarDe(recorrido)
+        return costo_actual, mejor_costo, aceptados
+
+
+def vecinoMasCercanoCoordenadas(coordenadas, inicio=0, k_inicial=16):
+    """
+    heurística del vecino más cercano a partir de coordenadas euclidianas, con un KD-tree
+    (scipy.spatial.cKDTree) en lugar de recorrer todas las no visitadas en cada paso.
+    Primero se consultan de una vez los k_inicial vecinos de todas las ciudades; en cada
+    paso se salta a la primera de esa lista que no se haya visitado (la lista está
+    ordenada, así que es la más cercana). Solo si todas ya se visitaron se consulta un
+    árbol con las no visitadas; las visitadas no se borran de ese árbol sino que se saltan,
+    y el árbol se reconstruye cuando la mitad de sus puntos ya se visitó.
+    Para entradas no euclidianas se usa vecinoMasCercano con la matriz.
+    """
+    from scipy.spatial import cKDTree
+
+    coordenadas = np.asarray(coordenadas, dtype=float)
+    n_ciudades = len(coordenadas)
+    if n_ciudades < 2:
+        return [inicio, inicio]
+    _, cercanos = cKDTree(coordenadas).query(coordenadas, k=min(k_inicial + 1, n_ciudades))
+    cercanos = cercanos.tolist()
+    visitada = [False] * n_ciudades
+    visitada[inicio] = True
+    recorrido = [inicio]
+    ciudad_actual = inicio
+
+    arbol = None
+    indices_arbol = None
+    visitadas_en_arbol = 0
+    while len(recorrido) < n_ciudades:
+        siguiente = None
+        for ciudad in cercanos[ciudad_actual]:
+            if not visitada[ciudad]:
+                siguiente = ciudad
+                break
+        if siguiente is None:
+            # todas las cercanas ya se visitaron: se busca en el árbol de las no visitadas
+            if arbol is None or visitadas_en_arbol * 2 > len(indices_arbol):
+                indices_arbol = np.flatnonzero(~np.array(visitada))
+                arbol = cKDTree(coordenadas[indices_arbol])
+                visitadas_en_arbol = 0
+            k = min(k_inicial, len(indices_arbol))
+            while siguiente is None:
+                _, vecinos = arbol.query(coordenadas[ciudad_actual], k=k)
+                for ciudad in indices_arbol[np.atleast_1d(vecinos)].tolist():
+                    if not visitada[ciudad]:
+                        siguiente = ciudad
+                        break
+                k = min(2 * k, len(indices_arbol))
+        if indices_arbol is not None:
+            visitadas_en_arbol += 1
+        visitada[siguiente] = True
+        recorrido.append(siguiente)
+        ciudad_actual = siguiente
+
+    recorrido.append(recorrido[0])
+    return recorrido
+
+
+def recocidoSimulado(matriz_dist, operadores=None, k_vecinos=K_VECINOS, tam_lote=None, esquema=EsquemaFijo,
+                     traza=None, verboso=True, coordenadas=None, punto_control=None, cada_niveles=50):
     """
     implementa el recocido simulado:
     1. calentamiento gradual.
     2. mantenimiento en temperatura máxima.
     3. enfriamiento gradual.
+    operadores es la mezcla de movimientos, p. ej. {"swap": 0.2, "2opt": 0.5, "oropt": 0.3};
+    2-opt y Or-opt se guían con las listas de los k_vecinos más cercanos de cada ciudad.
+    Con tam_lote se usa el modo por lotes: solo swaps, evaluados de tam_lote en tam_lote
+    con NumPy (ver ProblemaTSPLotes).
+    esquema es la clase (o fábrica) del esquema de temperatura, p. ej. EsquemaAdaptativo;
+    se construye con parametrosRecocido(n).
+    traza es un RegistroTraza opcional que guarda la convergencia por nivel;
+    con verboso=False no se imprime nada por nivel.
+    Si se dan las coordenadas, la solución inicial se construye con el KD-tree
+    (vecinoMasCercanoCoordenadas); si no, con la matriz.
+    matriz_dist también puede ser la ruta de un .npy hecho con construirMatrizDistancias;
+    se abre mapeado en memoria sin cargarlo completo.
+    Con punto_control (ruta de archivo) se guarda el estado completo cada cada_niveles
+    niveles; si el archivo ya existe, el recocido se reanuda desde ahí y sigue igual
+    que si nunca se hubiera detenido (mismos parámetros, misma matriz). Un archivo de
+    otra matriz (se compara su huella) lanza ValueError y al terminar el archivo se borra.
     """
-    n = len(matriz_dist)
-    #solución Inicial
-    solucion_actual = vecinoMasCercano(matriz_dist)
-    costo_actual = calcularDistanciaTotal(solucion_actual, matriz_dist)
-    mejor_solucion = list(solucion_actual)
-    mejor_costo = costo_actual
+    if isinstance(matriz_dist, (str, os.PathLike)):
+        matriz_dist = abrirMatrizDistancias(matriz_dist)
+    matriz_dist = np.asarray(matriz_dist)
+    if tam_lote:
+        if operadores is not None and any(peso > 0 for op, peso in operadores.items() if op != "swap"):
+            raise ValueError("El modo por lotes solo evalúa swaps")
+        operadores = {"swap": 1.0}
+    if operadores is None:
+        operadores = OPERADORES_POR_DEFECTO
+    prob_swap, prob_2opt = probabilidadesOperadores(operadores, matriz_dist)
 
-    print(f"Solución Inicial (Vecino Más Cercano): {solucion_actual}")
-    print(f"Costo Inicial: {costo_actual:.2f}\n")
+    n = len(matriz_dist)
+    #solución Inicial (al reanudar la da el punto de control)
+    if punto_control is not None and os.path.exists(punto_control):
+        solucion_actual = list(range(n)) + [0]
+        costo_actual = 0.0
+    else:
+        if coordenadas is not None:
+            solucion_actual = vecinoMasCercanoCoordenadas(coordenadas)
+        else:
+            solucion_actual = vecinoMasCercano(matriz_dist)
+        costo_actual = calcularDistanciaTotal(solucion_actual, matriz_dist)
+        if verboso:
+            print(f"Solución Inicial (Vecino Más Cercano): {solucion_actual}")
+            print(f"Costo Inicial: {costo_actual:.2f}\n")
+    # el recorrido actual y el mejor viven en arreglos que se modifican en sitio
+    if tam_lote:
+        problema = ProblemaTSPLotes(Recorrido(solucion_actual), matriz_dist, tam_lote)
+    else:
+        candidatos = construirListasCandidatos(matriz_dist, k_vecinos) if prob_swap < 1.0 else None
+        problema = ProblemaTSP(Recorrido(solucion_actual), matriz_dist, candidatos, prob_swap, prob_2opt)
 
     #parámetros de la simulacion
-    temp_de_arranque = float(n)  # empieza bajo
-    temp_maxima = float(n * 30)  # pico de temperatura
-    temp_minima = 1e-5  # criterio de paro
-    iteraciones_por_nivel = n * 10 # tamano del vecindario
-    factor_calentamiento = 1.02  # sube un en cada paso
-    iteraciones_en_pico = n * 40  # iteraciones  en temp máxima
-    factor_enfriamiento = 1.0 - (1.0 / (n * 10.0))  # enfria lentamente
+    parametros = parametrosRecocido(n)
+    iteraciones_por_nivel = parametros.pop("iteraciones_por_nivel")
 
     #control de fases
-    estado_actual = "CALENTAMIENTO"  # Estados: CALENTAMIENTO, PICO_TEMPERATURA, ENFRIAMIENTO
-    temp_actual = temp_de_arranque
-    contador_pico = 0
-    iteracion = 1
-    print("----- Iniciando Proceso de Recocido Simulado -----")
-    while True:
-        #exploración del vecindario
-        for _ in range(iteraciones_por_nivel):
-            vecino = list(solucion_actual)
-            i, j = random.sample(range(1, n), 2)
-            vecino[i], vecino[j] = vecino[j], vecino[i]
-            costo_vecino = calcularDistanciaTotal(vecino, matriz_dist)
-            diferencia_costo = costo_vecino - costo_actual
-            if diferencia_costo < 0 or random.random() < math.exp(-diferencia_costo / temp_actual):
-                solucion_actual = list(vecino)
-                costo_actual = costo_vecino
-                if costo_actual < mejor_costo:
-                    mejor_solucion = list(solucion_actual)
-                    mejor_costo = costo_actual
-
-        #logica de transición de fases y temperatura
-        if estado_actual == "CALENTAMIENTO":
-            temp_actual *= factor_calentamiento
-            if temp_actual >= temp_maxima:
-                temp_actual = temp_maxima
-                estado_actual = "PICO_TEMPERATURA"
-
-        elif estado_actual == "PICO_TEMPERATURA":
-            contador_pico += 1
-            if contador_pico >= iteraciones_en_pico:
-                estado_actual = "ENFRIAMIENTO"
-
-        elif estado_actual == "ENFRIAMIENTO":
-            temp_actual *= factor_enfriamiento
-            if temp_actual < temp_minima:
-                break  #termina el algoritmo
-
-        print(f"Iteración {iteracion:3}: Fase={estado_actual:<18} Temp={temp_actual:9.3f}, Costo Actual={costo_actual:8.2f}, Mejor Costo={mejor_costo:8.2f}")
-        iteracion += 1
-
-    return mejor_solucion, mejor_costo
+    control = esquema(**parametros)
+    if verboso:
+        print("----- Iniciando Proceso de Recocido Simulado -----")
+    _, mejor_costo = recocer(problema, control, costo_actual, iteraciones_por_nivel, traza=traza,
+                             verboso=verboso, punto_control=punto_control, cada_niveles=cada_niveles, n=n,
+                             huella=huellaArreglo(matriz_dist) if punto_control is not None else None)
+    return problema.mejorSolucion(), mejor_costo
+
+
+# estado de cada proceso del templado paralelo: la matriz se lee de memoria compartida
+_MEMORIA_COMPARTIDA = None
+_MATRIZ_COMPARTIDA = None
+_CANDIDATOS_COMPARTIDOS = None
+
+
+def _iniciarProcesoReplica(nombre_memoria, forma, tipo, candidatos):
+    """Inicializador del pool: adjunta la matriz compartida sin copiarla."""
+    global _MEMORIA_COMPARTIDA, _MATRIZ_COMPARTIDA, _CANDIDATOS_COMPARTIDOS
+    _MEMORIA_COMPARTIDA = shared_memory.SharedMemory(name=nombre_memoria)
+    _MATRIZ_COMPARTIDA = np.ndarray(forma, dtype=tipo, buffer=_MEMORIA_COMPARTIDA.buf)
+    _CANDIDATOS_COMPARTIDOS = candidatos
+
+
+def _correrReplica(solucion_actual, costo_actual, temperaturas, iteraciones, prob_swap, prob_2opt, semilla):
+    """
+    Corre una réplica por los niveles indicados en temperaturas (uno por nivel).
+    solucion_actual es un Recorrido (viaja entre procesos como dos arreglos int32).
+    Regresa (solucion_actual, costo_actual, mejor_costo, mejor_solucion o None).
+    """
+    random.seed(semilla)
+    np.random.seed(semilla)
+    problema = ProblemaTSP(solucion_actual, _MATRIZ_COMPARTIDA, _CANDIDATOS_COMPARTIDOS, prob_swap, prob_2opt)
+    costo_inicial = costo_actual
+    mejor_costo = costo_actual
+    for temp_actual in temperaturas:
+        costo_actual, mejor_costo, _ = explorarNivel(problema, costo_actual, mejor_costo, temp_actual, iteraciones)
+    mejora = problema.mejor if mejor_costo < costo_inicial else None
+    return problema.recorrido, costo_actual, mejor_costo, mejora
+
+
+def recocidoSimuladoParalelo(matriz_dist, num_replicas=None, niveles_por_intercambio=10,
+                             escala_minima=0.05, operadores=None, k_vecinos=K_VECINOS, semilla=None):
+    """
+    Templado paralelo (parallel tempering) sobre el mismo esquema de
+    calentamiento, pico y enfriamiento de recocidoSimulado.
+    Cada réplica r corre en un proceso con la temperatura del esquema multiplicada
+    por escalas[r] (de 1 a escala_minima, geométrica). Cada niveles_por_intercambio
+    niveles, réplicas vecinas intercambian sus estados con probabilidad
+    min(1, exp((1/T_r - 1/T_s) * (E_r - E_s))). La matriz de distancias se comparte
+    entre procesos con shared_memory, con su mismo tipo (float32 ocupa la mitad) y copiada
+    por bloques de filas, así una matriz mapeada en memoria no se carga completa antes de
+    compartirla. Regresa el mejor recorrido global y su costo.
+    """
+    if isinstance(matriz_dist, (str, os.PathLike)):
+        matriz_dist = abrirMatrizDistancias(matriz_dist)
+    if operadores is None:
+        operadores = OPERADORES_POR_DEFECTO
+    prob_swap, prob_2opt = probabilidadesOperadores(operadores, matriz_dist)
+    if num_replicas is None:
+        num_replicas = os.cpu_count() or 1
+    generador = random.Random(semilla)
+
+    matriz_dist = np.asarray(matriz_dist)
+    n = len(matriz_dist)
+    parametros = parametrosRecocido(n)
+    iteraciones_por_nivel = parametros.pop("iteraciones_por_nivel")
+    escalas = np.geomspace(1.0, escala_minima, num_replicas) if num_replicas > 1 else np.ones(1)
+
+    memoria = shared_memory.SharedMemory(create=True, size=matriz_dist.nbytes)
+    try:
+        # desde aquí el proceso principal también lee la copia compartida
+        matriz_dist = copiarPorBloques(matriz_dist, np.ndarray(matriz_dist.shape, dtype=matriz_dist.dtype,
+                                                               buffer=memoria.buf))
+        candidatos = construirListasCandidatos(matriz_dist, k_vecinos) if prob_swap < 1.0 else None
+
+        solucion_inicial = vecinoMasCercano(matriz_dist)
+        costo_inicial = calcularDistanciaTotal(solucion_inicial, matriz_dist)
+        replicas = [(Recorrido(solucion_inicial), costo_inicial) for _ in range(num_replicas)]
+        mejor_solucion = Recorrido(solucion_inicial)
+        mejor_costo = costo_inicial
+        print(f"Costo Inicial: {costo_inicial:.2f}  Réplicas: {num_replicas}\n")
+
+        control = EsquemaFijo(**parametros)
+        ronda = 1
+        intercambios_aceptados = 0
+        with ProcessPoolExecutor(max_workers=num_replicas, initializer=_iniciarProcesoReplica,
+                                 initargs=(memoria.name, matriz_dist.shape, matriz_dist.dtype, candidatos)) as pool:
+            print("----- Iniciando Templado Paralelo -----")
+            while not control.terminado:
+                # temperaturas base de los niveles de esta ronda según el esquema de fases
+                temperaturas = []
+                while len(temperaturas) < niveles_por_intercambio and not control.terminado:
+                    temperaturas.append(control.temperatura)
+                    control.registrarNivel()
+
+                futuros = [pool.submit(_correrReplica, solucion, costo, [t * escala for t in temperaturas],
+                                       iteraciones_por_nivel, prob_swap, prob_2opt,
+                                       generador.getrandbits(32))
+                           for (solucion, costo), escala in zip(replicas, escalas)]
+                replicas = []
+                for futuro in futuros:
+                    solucion, costo, mejor_costo_replica, mejora = futuro.result()
+                    replicas.append((solucion, costo))
+                    if mejora is not None and mejor_costo_replica < mejor_costo:
+                        mejor_solucion = mejora
+                        mejor_costo = mejor_costo_replica
+
+                # intercambio entre réplicas vecinas (pares o nones, alternando por ronda)
+                temp_ronda = temperaturas[-1]
+                for r in range(ronda % 2, num_replicas - 1, 2):
+                    beta_r = 1.0 / (temp_ronda * escalas[r])
+                    beta_s = 1.0 / (temp_ronda * escalas[r + 1])
+                    exponente = (beta_r - beta_s) * (replicas[r][1] - replicas[r + 1][1])
+                    if exponente >= 0 or generador.random() < math.exp(exponente):
+                        replicas[r], replicas[r + 1] = replicas[r + 1], replicas[r]
+                        intercambios_aceptados += 1
+
+                costos = ", ".join(f"{costo:.2f}" for _, costo in replicas)
+                print(f"Ronda {ronda:3}: Fase={control.fase:<18} Temp={control.temperatura:9.3f}, Mejor Costo={mejor_costo:8.2f}, Intercambios={intercambios_aceptados}, Costos=[{costos}]")
+                ronda += 1
+    finally:
+        del matriz_dist  # la vista sobre memoria.buf debe soltarse antes de cerrar
+        memoria.close()
+        memoria.unlink()
+
+    return mejor_solucion.tolist(), mejor_costo
 
 
 if __name__ == "__main__":
     NUM_CIUDADES = 15
     # generación aleatoria del problema
     coordenadas = np.random.rand(NUM_CIUDADES, 2) * 100
-    distancias = np.zeros((NUM_CIUDADES, NUM_CIUDADES))
-    for i in range(NUM_CIUDADES):
-        for j in range(NUM_CIUDADES):
-            distancias[i][j] = np.linalg.norm(coordenadas[i] - coordenadas[j])
+    distancias = construirMatrizDistancias(coordenadas)
     print(f"--- Problema del  Viajero con {NUM_CIUDADES} ciudades ---")
     recorrido_optimo, costo_optimo = recocidoSimulado(distancias)
     print("\n--- Resultados Finales ---")